@@ -76,12 +76,12 @@ from .tooltip import TooltipBase, OnHoverTooltipBase, Hovertip
 from .ncvutils import DIMMETHODS
 from .ncvutils import add_cyclic, has_cyclic, clone_ncvmain
 from .ncvutils import format_coord_contour, format_coord_map
-from .ncvutils import format_coord_scatter, get_slice
+from .ncvutils import format_coord_scatter, get_cmaps, get_slice
 from .ncvutils import list_intersection, selvar, set_axis_label, set_miss
 from .ncvutils import spinbox_values, vardim2var, zip_dim_name_length
 #
 # common methods of all panels
-from .ncvmethods import analyse_netcdf, get_miss, get_slice_miss
+from .ncvmethods import analyse_netcdf, get_miss, get_slice_miss, load_imaps
 from .ncvmethods import set_dim_lat, set_dim_lon, set_dim_var
 from .ncvmethods import set_dim_x, set_dim_y, set_dim_y2, set_dim_z
 #
@@ -115,10 +115,10 @@ __all__ = ['TooltipBase', 'OnHoverTooltipBase', 'Hovertip',
            "DIMMETHODS",
            "add_cyclic", "has_cyclic", "clone_ncvmain",
            "format_coord_contour", "format_coord_map",
-           "format_coord_scatter", "get_slice",
+           "format_coord_scatter", "get_cmaps", "get_slice",
            "list_intersection", "selvar", "set_axis_label", "set_miss",
            "spinbox_values", "vardim2var", "zip_dim_name_length",
-           "analyse_netcdf", "get_miss", "get_slice_miss",
+           "analyse_netcdf", "get_miss", "get_slice_miss", "load_imaps",
            "set_dim_lat", "set_dim_lon", "set_dim_var",
            "set_dim_x", "set_dim_y", "set_dim_y2", "set_dim_z",
            "Tooltip",
@@ -32,10 +32,13 @@ History
    * Move themes/ and images/ back to src/ncvue/, Feb 2024, Matthias Cuntz
    * Add Quit button, Nov 2024, Matthias Cuntz
    * Use CustomTkinter if installed, Nov 2024, Matthias Cuntz
+   * Load colormap images only when cmap menu is opened,
+     Oct 2026, Matthias Cuntz
+   * Share colormaps and their images between panels,
+     Oct 2026, Matthias Cuntz
+   * Use draw_idle instead of draw in redraw, Oct 2026, Matthias Cuntz
 
 """
-import os
-import sys
 import tkinter as tk
 try:
     from customtkinter import CTkFrame as Frame
@@ -51,9 +54,10 @@ except ModuleNotFoundError:
     ihavectk = False
 import netCDF4 as nc
 import numpy as np
-from .ncvutils import clone_ncvmain, format_coord_contour, selvar
+from .ncvutils import clone_ncvmain, format_coord_contour, get_cmaps
+from .ncvutils import selvar
 from .ncvutils import set_axis_label, vardim2var
-from .ncvmethods import analyse_netcdf, get_slice_miss
+from .ncvmethods import analyse_netcdf, get_slice_miss, load_imaps
 from .ncvmethods import set_dim_x, set_dim_y, set_dim_z
 from .ncvwidgets import add_checkbutton, add_combobox, add_entry, add_imagemenu
 from .ncvwidgets import add_spinbox, add_tooltip
@@ -118,17 +122,9 @@ class ncvContour(Frame):
         # selections and options
         columns = [''] + self.cols
 
-        allcmaps = plt.colormaps()
-        self.cmaps  = [ i for i in allcmaps if not i.endswith('_r') ]
-        self.cmaps.sort()
-        # self.imaps  = [ tk.PhotoImage(file=os.path.dirname(__file__) +
-        #                               '/../images/' + i + '.png')
-        #                 for i in self.cmaps ]
-        bundle_dir = getattr(sys, '_MEIPASS',
-                             os.path.abspath(os.path.dirname(__file__)))
-        self.imaps  = [ tk.PhotoImage(file=bundle_dir +
-                                      '/images/' + i + '.png')
-                        for i in self.cmaps ]
+        # shared by all panels, images are loaded when the cmap menu
+        # is opened (load_imaps)
+        self.cmaps, self.imapfiles, self.imaps = get_cmaps(self)
         if ihavectk:
             # width of combo boxes in px
             combowidth = 288
@@ -343,8 +339,10 @@ class ncvContour(Frame):
         self.cmapframe, self.cmaplbl, self.cmap, self.cmaptip = add_imagemenu(
             self.rowcmap, label='cmap', values=self.cmaps,
             images=self.imaps, command=self.selected_cmap,
-            tooltip='Choose colormap')
+            tooltip='Choose colormap',
+            postcommand=lambda: load_imaps(self))
         self.cmapframe.pack(side=tk.LEFT)
+        load_imaps(self, ['RdYlBu'])
         self.cmap['text']  = 'RdYlBu'
         self.cmap['image'] = self.imaps[self.cmaps.index('RdYlBu')]
         self.rev_cmapframe, self.rev_cmaplbl, self.rev_cmap, self.rev_cmaptip = (
@@ -906,5 +904,5 @@ class ncvContour(Frame):
                                        colors='w', linestyles='solid',
                                        linewidth=0.5)
         # redraw
-        self.canvas.draw()
+        self.canvas.draw_idle()
         self.toolbar.update()
@@ -41,10 +41,81 @@ History
      Jul 2024, Matthias Cuntz
    * Add Quit button, Nov 2024, Matthias Cuntz
    * Use CustomTkinter if installed, Nov 2024, Matthias Cuntz
+   * Collapse time step arithmetic of animation into function _advance,
+     Oct 2026, Matthias Cuntz
+   * Blit animation so that only data, features and grid are redrawn,
+     Oct 2026, Matthias Cuntz
+   * Use draw_idle instead of draw also in redraw method,
+     Oct 2026, Matthias Cuntz
+   * Set new data on existing mesh in update method, Oct 2026, Matthias Cuntz
+   * Use pcolorfast for regular grids on PlateCarree projection,
+     Oct 2026, Matthias Cuntz
+   * Contour in projection space with transform_first, Oct 2026, Matthias Cuntz
+   * Keep features on map and only toggle their visibility (set_features),
+     Oct 2026, Matthias Cuntz
+   * No grid lines in gridliner of labels, Oct 2026, Matthias Cuntz
+   * Stop animation in one method stop_anim, Oct 2026, Matthias Cuntz
+   * Take plotting options in update from redraw instead of widgets,
+     Oct 2026, Matthias Cuntz
+   * Reuse data array in update, Oct 2026, Matthias Cuntz
+   * Remove contours with ContourSet.remove in update,
+     Oct 2026, Matthias Cuntz
+   * Fixed contour levels if vmin and vmax are given,
+     Oct 2026, Matthias Cuntz
+   * Return early from update if time step did not change,
+     Oct 2026, Matthias Cuntz
+   * Cache frames of animation, plot data in new method plot_tstep,
+     Oct 2026, Matthias Cuntz
+   * Read random fields in one call in get_vminmax, Oct 2026, Matthias Cuntz
+   * Cache vmin/vmax of variables in get_vminmax, Oct 2026, Matthias Cuntz
+   * Transform coordinates of contours only once in new method
+     plot_contour, Oct 2026, Matthias Cuntz
+   * Load colormap images only when cmap menu is opened,
+     Oct 2026, Matthias Cuntz
+   * Share colormaps, their images, and projections between panels,
+     Oct 2026, Matthias Cuntz
+   * Fewer passes over longitudes to check for global grid and
+     central longitude, Oct 2026, Matthias Cuntz
+   * Redraw after short delay if spinboxes or entries changed,
+     Oct 2026, Matthias Cuntz
+   * Set new data and colour limits on existing mesh in animation also
+     if vmin or vmax are not given, Oct 2026, Matthias Cuntz
+   * Number of fields is product of leading dimensions in get_vminmax,
+     random fields also for 'all' if variable is larger than 1 GB,
+     Oct 2026, Matthias Cuntz
+   * Shift longitudes into the same array in each frame of animation,
+     Oct 2026, Matthias Cuntz
+   * Read variable into memory at first frame of animation,
+     Oct 2026, Matthias Cuntz
+   * Reuse spinboxes of dimensions in reinit, Oct 2026, Matthias Cuntz
+   * Release data and caches of old file in reinit, Oct 2026, Matthias Cuntz
+   * Index of variables for next/previous buttons, Oct 2026, Matthias Cuntz
+   * Broadcast 1D coordinates without copies, Oct 2026, Matthias Cuntz
+   * Clip data to vmin/vmax with np.clip, Oct 2026, Matthias Cuntz
+   * Hide instead of destroy unused dimension spinboxes in reinit,
+     Oct 2026, Matthias Cuntz
+   * Get missing values only once per variable in animation,
+     Oct 2026, Matthias Cuntz
+   * Round time of all time steps once for time label,
+     Oct 2026, Matthias Cuntz
+   * Set colormap on current plot without redrawing the map,
+     Oct 2026, Matthias Cuntz
+   * Do not draw animated artists twice when saving the figure,
+     Oct 2026, Matthias Cuntz
+   * Sample at least 50 fields if leading dimensions have different
+     sizes in get_vminmax, Oct 2026, Matthias Cuntz
+   * Keep mask of masked arrays in plot_contour, Oct 2026, Matthias Cuntz
+   * Limit frame cache by bytes and keep only images of frames,
+     Oct 2026, Matthias Cuntz
+   * Read variable into memory only when animation is started, up to
+     256 MiB, Oct 2026, Matthias Cuntz
+   * Same check for global longitudes in __init__ and reinit,
+     Oct 2026, Matthias Cuntz
+   * Colour limits of frames with autoscale_None of norm,
+     Oct 2026, Matthias Cuntz
+   * Cancel pending redraw if panel is destroyed, Oct 2026, Matthias Cuntz
 
 """
-import os
-import sys
 import tkinter as tk
 try:
     from customtkinter import CTkFrame as Frame
@@ -63,8 +134,10 @@ import cartopy.feature as cfeature
 import netCDF4 as nc
 import numpy as np
 from .ncvutils import add_cyclic, clone_ncvmain, format_coord_map, selvar
+from .ncvutils import get_cmaps
 from .ncvutils import set_axis_label, set_miss, vardim2var
 from .ncvmethods import analyse_netcdf, get_slice_miss, get_miss
+from .ncvmethods import load_imaps
 from .ncvmethods import set_dim_lon, set_dim_lat, set_dim_var
 from .ncvwidgets import add_checkbutton, add_combobox, add_entry, add_imagemenu
 from .ncvwidgets import add_menu, add_scale, add_spinbox, add_tooltip
@@ -82,6 +155,65 @@ except OSError:
 __all__ = ['ncvMap']
 
 
+REPEATMODES = ['once', 'repeat', 'reflect']
+# maximum size in bytes of variable for minimum and maximum of all fields
+MAXALLBYTES = 2**30
+# maximum size in bytes of frames (RGBA images) kept in cache of animation
+MAXFRAMEBYTES = 2**27
+# maximum size in bytes of variable kept in memory for animation,
+# in addition to the frame cache
+MAXBLOCKBYTES = 2**28
+# delay of redraw in ms after spinbox or entry changes, longer than
+# the repeat interval of pressed spinbox arrows (100 ms)
+REDRAWDELAY = 150
+# projections with keyword central_longitude
+PROJS = ['AlbersEqualArea', 'AzimuthalEquidistant', 'EckertI',
+         'EckertII', 'EckertIII', 'EckertIV', 'EckertV',
+         'EckertVI', 'EqualEarth', 'EquidistantConic',
+         'InterruptedGoodeHomolosine',
+         'LambertAzimuthalEqualArea', 'LambertConformal',
+         'LambertCylindrical', 'Mercator', 'Miller', 'Mollweide',
+         'NorthPolarStereo', 'PlateCarree', 'Robinson',
+         'Sinusoidal', 'SouthPolarStereo', 'Stereographic']
+IPROJS = [ getattr(ccrs, i) for i in PROJS ]
+
+
+def _advance(it, inc, n, mode):
+    """
+    Next time step of animation.
+
+    Parameters
+    ----------
+    it : int
+        Current time step
+    inc : int
+        Increment, 1 for forward and -1 for backward run
+    n : int
+        Number of time steps
+    mode : int
+        Index in REPEATMODES: 0 once, 1 repeat, 2 reflect
+
+    Returns
+    -------
+    tuple of int
+        Next time step and new increment. Increment is 0 if animation
+        should stop.
+
+    """
+    nxt = it + inc
+    if (nxt >= 0) and (nxt < n):
+        return nxt, inc
+    if mode == 0:  # once
+        return it, 0
+    if mode == 1:  # repeat
+        return (0 if inc > 0 else n - 1), inc
+    # reflect
+    nxt = it - inc
+    if (nxt >= 0) and (nxt < n):
+        return nxt, -inc
+    return it, 0
+
+
 class ncvMap(Frame):
     """
     Panel for maps.
@@ -132,38 +264,17 @@ class ncvMap(Frame):
 
         # selections and options
         columns = [''] + self.cols
+        # variables and their index for next/previous buttons
+        self.icolumns = columns
+        self.ivindex  = { c: i for i, c in enumerate(columns) }
 
-        allcmaps = plt.colormaps()
-        self.cmaps  = [ i for i in allcmaps if not i.endswith('_r') ]
-        self.cmaps.sort()
-        # self.imaps  = [ tk.PhotoImage(file=os.path.dirname(__file__) +
-        #                               '/../images/' + i + '.png')
-        #                 for i in self.cmaps ]
-        bundle_dir = getattr(sys, '_MEIPASS',
-                             os.path.abspath(os.path.dirname(__file__)))
-        self.imaps  = [ tk.PhotoImage(file=bundle_dir +
-                                      '/images/' + i + '.png')
-                        for i in self.cmaps ]
+        # shared by all panels, images are loaded when the cmap menu
+        # is opened (load_imaps)
+        self.cmaps, self.imapfiles, self.imaps = get_cmaps(self)
 
         # only projections with keyword: central_longitude
-        self.projs = ['AlbersEqualArea', 'AzimuthalEquidistant', 'EckertI',
-                      'EckertII', 'EckertIII', 'EckertIV', 'EckertV',
-                      'EckertVI', 'EqualEarth', 'EquidistantConic',
-                      'InterruptedGoodeHomolosine',
-                      'LambertAzimuthalEqualArea', 'LambertConformal',
-                      'LambertCylindrical', 'Mercator', 'Miller', 'Mollweide',
-                      'NorthPolarStereo', 'PlateCarree', 'Robinson',
-                      'Sinusoidal', 'SouthPolarStereo', 'Stereographic']
-        self.iprojs = [ccrs.AlbersEqualArea, ccrs.AzimuthalEquidistant,
-                       ccrs.EckertI, ccrs.EckertII, ccrs.EckertIII,
-                       ccrs.EckertIV, ccrs.EckertV, ccrs.EckertVI,
-                       ccrs.EqualEarth, ccrs.EquidistantConic,
-                       ccrs.InterruptedGoodeHomolosine,
-                       ccrs.LambertAzimuthalEqualArea, ccrs.LambertConformal,
-                       ccrs.LambertCylindrical, ccrs.Mercator, ccrs.Miller,
-                       ccrs.Mollweide, ccrs.NorthPolarStereo, ccrs.PlateCarree,
-                       ccrs.Robinson, ccrs.Sinusoidal, ccrs.SouthPolarStereo,
-                       ccrs.Stereographic]
+        self.projs  = PROJS
+        self.iprojs = IPROJS
         if ihavectk:
             # width of combo boxes in px
             combowidth = 297
@@ -294,7 +405,7 @@ class ncvMap(Frame):
         # repeat
         spacer = Label(self.rowt, text=' ' * 1)
         spacer.pack(side=tk.LEFT)
-        reps = ['once', 'repeat', 'reflect']
+        reps = REPEATMODES
         tstr  = 'Run time steps once, repeat from start when at end,'
         tstr += ' or continue running backwards when at end'
         self.repeatframe, self.repeatlbl, self.repeat, self.repeattip = (
@@ -477,13 +588,15 @@ class ncvMap(Frame):
         self.cmapframe, self.cmaplbl, self.cmap, self.cmaptip = add_imagemenu(
             self.rowcmap, label='cmap', values=self.cmaps,
             images=self.imaps, command=self.selected_cmap,
-            tooltip='Choose colormap')
+            tooltip='Choose colormap',
+            postcommand=lambda: load_imaps(self))
+        load_imaps(self, ['RdYlBu'])
         self.cmap['text']  = 'RdYlBu'
         self.cmap['image'] = self.imaps[self.cmaps.index('RdYlBu')]
         self.cmapframe.pack(side=tk.LEFT)
         self.rev_cmapframe, self.rev_cmaplbl, self.rev_cmap, self.rev_cmaptip = (
             add_checkbutton(self.rowcmap, label='reverse cmap', value=False,
-                            command=self.checked,
+                            command=self.checked_cmap,
                             tooltip='Reverse colormap'))
         self.rev_cmapframe.pack(side=tk.LEFT)
         self.meshframe, self.meshlbl, self.mesh, self.meshtip = (
@@ -499,27 +612,27 @@ class ncvMap(Frame):
         self.iglobalframe.pack(side=tk.LEFT)
         self.coastframe, self.coastlbl, self.coast, self.coasttip = (
             add_checkbutton(self.rowcmap, label='coast', value=True,
-                            command=self.checked,
+                            command=self.checked_features,
                             tooltip='Draw continental coast lines'))
         self.coastframe.pack(side=tk.LEFT)
         self.bordersframe, self.borderslbl, self.borders, self.borderstip = (
             add_checkbutton(self.rowcmap, label='borders', value=False,
-                            command=self.checked,
+                            command=self.checked_features,
                             tooltip='Draw country borders'))
         self.bordersframe.pack(side=tk.LEFT)
         self.riversframe, self.riverslbl, self.rivers, self.riverstip = (
             add_checkbutton(self.rowcmap, label='rivers', value=False,
-                            command=self.checked,
+                            command=self.checked_features,
                             tooltip='Draw rivers'))
         self.riversframe.pack(side=tk.LEFT)
         self.lakesframe, self.lakeslbl, self.lakes, self.lakestip = (
             add_checkbutton(self.rowcmap, label='lakes', value=False,
-                            command=self.checked,
+                            command=self.checked_features,
                             tooltip='Draw major lakes'))
         self.lakesframe.pack(side=tk.LEFT)
         self.gridframe, self.gridlbl, self.grid, self.gridtip = (
             add_checkbutton(self.rowcmap, label='grid', value=False,
-                            command=self.checked,
+                            command=self.checked_features,
                             tooltip='Draw major grid lines'))
         self.gridframe.pack(side=tk.LEFT)
 
@@ -562,17 +675,7 @@ class ncvMap(Frame):
             set_dim_lon(self)
 
         # set global
-        x = self.lon.get()
-        if (x != ''):
-            gx, vx = vardim2var(x, self.groups)
-            xx = selvar(self, vx)
-            xx = get_slice_miss(self, self.lond, xx)
-            if np.any(np.isfinite(xx)):
-                xx = (xx + 360.) % 360.
-            if (xx.max() - xx.min()) > 150.:
-                self.iglobal.set(1)
-            else:
-                self.iglobal.set(0)
+        self.set_global()
 
         # animation
         rep = self.repeat.get()
@@ -583,20 +686,70 @@ class ncvMap(Frame):
         self.anim_first   = True   # True: stops in self.update at first call
         self.anim_running = True   # True/False: animation running or not
         self.anim_inc     = 1      # 1/-1: forward or backward run
+        self.anim_mode    = REPEATMODES.index(rep)  # 0/1/2: once/rep/refl
+        self.ivar        = None  # netcdf variable of plotted data
+        self.ivarblock   = None  # (variable, data, missing values)
+        self.iit         = None  # time step of shown frame
+        self.iitcc       = None  # time step of data in self.cc
+        self.iitvv       = None  # time step of data in self.ivv
+        self.iframes     = {}    # cache of images of shown frames
+        self.cc          = None  # plotted data
+        self.ioverlay    = []    # features and grid on top of data
+        self.ifeatures   = {}    # feature artists of current axes
+        self.ilabels     = None  # gridliner with labels of coast
+        self.ibackground = None  # map background for blitting
+        self.idefault    = {}    # default lon/lat if not selected
+        self.ivvbuf      = None  # data in animation
+        self.ivvcbuf     = None  # data with cyclic point in animation
+        self.ivvrbuf     = None  # data with shifted lon in animation
+        self.ivminmax    = {}    # (vmin, vmax) of variables
+        self.ixyproj     = None  # coordinates of contours in projection
+        self.iredraw     = None  # id of pending redraw
+        self.itime       = {}    # rounded time for label of time steps
+        self.canvas.mpl_connect('draw_event', self.canvas_drawn)
+        self.bind('<Destroy>', self.destroyed)
         maxtime = 1
         for vz in self.tvar:
             if vz:
                 zz = selvar(self, vz)
                 maxtime = max(zz.size, maxtime)
         self.anim = animation.FuncAnimation(self.figure, self.update,
-                                            init_func=self.redraw,
+                                            init_func=self.animated_artists,
                                             interval=self.delayval.get(),
-                                            repeat=irepeat, save_count=maxtime)
+                                            repeat=irepeat, save_count=maxtime,
+                                            blit=True)
+        self.redraw()
 
     #
     # Bindings
     #
 
+    def canvas_drawn(self, event):
+        """
+        Command called if the figure canvas was drawn.
+
+        `event` is the matplotlib draw_event.
+
+        Saves the background of the map for blitting and draws the
+        animated artists on top of it.
+
+        Does nothing if the figure is saved to a file because the
+        animated artists are drawn by matplotlib while saving.
+
+        """
+        if self.cc is None:
+            return
+        if (event.canvas is not self.canvas) or self.canvas.is_saving():
+            return
+        # cached frames have the old background
+        self.iframes = {}
+        if (self.iit is not None) and (self.iitcc != self.iit):
+            # frame was restored from cache
+            self.plot_tstep(self.iit)
+        self.ibackground = self.canvas.copy_from_bbox(self.axes.bbox)
+        for aa in self.animated_artists():
+            aa.draw(event.renderer)
+
     def checked(self):
         """
         Command called if any checkbutton was checked or unchecked.
@@ -606,6 +759,19 @@ class ncvMap(Frame):
         """
         self.redraw()
 
+    def checked_features(self):
+        """
+        Command called if any checkbutton of the map features coast,
+        borders, rivers, lakes, or grid was checked or unchecked.
+
+        Shows or hides features on the current map without redrawing
+        the data.
+
+        """
+        self.set_features()
+        self.animated_artists()
+        self.canvas.draw_idle()
+
     def checked_all(self):
         """
         Command called if any checkbutton 'all' for vmin/vmax was checked or
@@ -619,6 +785,16 @@ class ncvMap(Frame):
         self.vmax.set(vmax)
         self.redraw()
 
+    def checked_cmap(self):
+        """
+        Command called if checkbutton 'reverse cmap' was checked or
+        unchecked.
+
+        Sets the reversed or original colormap on the current plot.
+
+        """
+        self.set_cmap()
+
     def delay_t(self, delay):
         """
         Command called if delay scale was changed.
@@ -628,16 +804,31 @@ class ncvMap(Frame):
         """
         self.anim.event_source.interval = int(float(delay))
 
+    def destroyed(self, event):
+        """
+        Command called if the panel is destroyed, e.g. if its window
+        is closed.
+
+        `event` is the Tk Destroy event.
+
+        Cancels a pending redraw and stops the animation.
+
+        """
+        if self.iredraw is not None:
+            self.after_cancel(self.iredraw)
+            self.iredraw = None
+        self.stop_anim()
+
     def entered_clon(self, event):
         """
         Command called if values central longitude was entered.
 
         Triggering `event` was bound to entry.
 
-        Redraws plot.
+        Redraws plot after a short delay.
 
         """
-        self.redraw()
+        self.redraw_later()
 
     def entered_v(self, event):
         """
@@ -645,10 +836,10 @@ class ncvMap(Frame):
 
         Triggering `event` was bound to entry.
 
-        Redraws plot.
+        Redraws plot after a short delay.
 
         """
-        self.redraw()
+        self.redraw_later()
 
     def first_t(self):
         """
@@ -725,6 +916,7 @@ class ncvMap(Frame):
 
         """
         if not self.anim_running:
+            self.read_block()
             self.anim_inc = 1
             self.anim.event_source.start()
             self.anim_running = True
@@ -737,20 +929,11 @@ class ncvMap(Frame):
         try:
             it = int(self.vdval[self.iunlim].get())
         except ValueError:
-            it = -1
-        if (it < self.nunlim - 1) and (it >= 0):
-            it += 1
+            return
+        it, inc = _advance(it, 1, self.nunlim, self.anim_mode)
+        if inc != 0:
             self.set_tstep(it)
             self.update(it, isframe=True)
-        elif it == self.nunlim - 1:
-            rep = self.repeat.get()
-            if rep != 'once':
-                if rep == 'repeat':
-                    it = 0
-                else:  # reflect
-                    it -= 1
-                self.set_tstep(it)
-                self.update(it, isframe=True)
 
     def next_v(self):
         """
@@ -760,11 +943,8 @@ class ncvMap(Frame):
 
         """
         v = self.v.get()
-        if ihavectk:
-            cols = self.v.cget('values')
-        else:
-            cols = self.v['values']
-        idx  = cols.index(v)
+        cols = self.icolumns
+        idx  = self.ivindex[v]
         idx += 1
         if idx < len(cols):
             self.v.set(cols[idx])
@@ -789,8 +969,7 @@ class ncvMap(Frame):
 
         """
         if self.anim_running:
-            self.anim.event_source.stop()
-            self.anim_running = False
+            self.stop_anim()
 
     def prev_t(self):
         """
@@ -800,20 +979,11 @@ class ncvMap(Frame):
         try:
             it = int(self.vdval[self.iunlim].get())
         except ValueError:
-            it = -1
-        if it > 0:
-            it -= 1
+            return
+        it, inc = _advance(it, -1, self.nunlim, self.anim_mode)
+        if inc != 0:
             self.set_tstep(it)
             self.update(it, isframe=True)
-        elif it == 0:
-            rep = self.repeat.get()
-            if rep != 'once':
-                if rep == 'repeat':
-                    it = self.nunlim - 1
-                else:  # reflect
-                    it += 1
-                self.set_tstep(it)
-                self.update(it, isframe=True)
 
     def prev_v(self):
         """
@@ -824,11 +994,8 @@ class ncvMap(Frame):
 
         """
         v = self.v.get()
-        if ihavectk:
-            cols = self.v.cget('values')
-        else:
-            cols = self.v['values']
-        idx  = cols.index(v)
+        cols = self.icolumns
+        idx  = self.ivindex[v]
         idx -= 1
         if idx > 0:
             self.v.set(cols[idx])
@@ -853,6 +1020,7 @@ class ncvMap(Frame):
 
         """
         if not self.anim_running:
+            self.read_block()
             self.anim_inc = -1
             self.anim.event_source.start()
             self.anim_running = True
@@ -871,6 +1039,7 @@ class ncvMap(Frame):
             # need not to stop also for reflect
             irepeat = True
         self.anim.repeat = irepeat
+        self.anim_mode   = REPEATMODES.index(rep)
 
     def selected_cmap(self, value):
         """
@@ -883,7 +1052,7 @@ class ncvMap(Frame):
         """
         self.cmap['text']  = value
         self.cmap['image'] = self.imaps[self.cmaps.index(value)]
-        self.redraw()
+        self.set_cmap()
 
     def selected_lat(self, event):
         """
@@ -958,10 +1127,10 @@ class ncvMap(Frame):
 
         Triggering `event` was bound to the spinbox.
 
-        Redraws plot.
+        Redraws plot after a short delay.
 
         """
-        self.redraw()
+        self.redraw_later()
 
     def spinned_lat(self, event=None):
         """
@@ -969,10 +1138,10 @@ class ncvMap(Frame):
 
         Triggering `event` was bound to the spinbox.
 
-        Redraws plot.
+        Redraws plot after a short delay.
 
         """
-        self.redraw()
+        self.redraw_later()
 
     def spinned_v(self, event=None):
         """
@@ -980,7 +1149,7 @@ class ncvMap(Frame):
 
         Triggering `event` was bound to the spinbox.
 
-        Redraws plot.
+        Redraws plot after a short delay.
 
         """
         try:
@@ -988,7 +1157,7 @@ class ncvMap(Frame):
             self.set_tstep(it)
         except ValueError:  # mean, std, etc.
             pass
-        self.redraw()
+        self.redraw_later()
 
     def tstep_t(self, step):
         """
@@ -1005,6 +1174,43 @@ class ncvMap(Frame):
     # Methods
     #
 
+    def animated_artists(self):
+        """
+        Artists that are redrawn in each frame of the animation.
+
+        These are the plotted data and everything that is drawn on top of
+        it, i.e. features, grid lines and the map boundary. All of them are
+        set animated so that they are not part of the blitting background.
+
+        Returns an empty tuple if no data is plotted.
+
+        """
+        if self.cc is None:
+            return ()
+        artists = [self.cc]
+        if hasattr(self.cc, '_wrapped_collection_fix'):
+            artists.append(self.cc._wrapped_collection_fix)
+        artists.extend([ aa for aa in self.ioverlay if aa.get_visible() ])
+        artists.append(self.axes.spines['geo'])
+        artists.sort(key=lambda aa: aa.get_zorder())
+        for aa in artists:
+            aa.set_animated(True)
+        return tuple(artists)
+
+    def format_coord(self, x, y):
+        """
+        Formatter function for the coordinates and the value of the
+        shown frame at `x` and `y`.
+
+        Frames restored from the cache have no data, which is read
+        only when needed.
+
+        """
+        if (self.iit is not None) and (self.iitvv != self.iit):
+            self.read_tstep(self.iit)
+        return format_coord_map(x, y, self.axes, self.ixx, self.iyy,
+                                self.ivv)
+
     def get_vminmax(self):
         from numpy.random import default_rng
         v = self.v.get()
@@ -1012,36 +1218,132 @@ class ncvMap(Frame):
             gz, vz = vardim2var(v, self.groups)
             if vz == self.tname[gz]:
                 return (0, 1)
+            iall  = self.vall.get()
+            if (v, iall) in self.ivminmax:
+                return self.ivminmax[(v, iall)]
             vv = selvar(self, vz)
             imiss = get_miss(self, vv)
-            iall  = self.vall.get()
-            if iall or (np.sum(vv.shape[:-2]) < 50):
+            # number of 2D fields
+            nfields = int(np.prod(vv.shape[:-2]))
+            if ( iall and (nfields >= 50) and
+                 (vv.size * np.dtype(vv.dtype).itemsize > MAXALLBYTES) ):
+                estr  = ('Map: var (' + vz + ') too large to get minimum'
+                         ' and maximum of all fields. Use random fields.')
+                print(estr)
+                iall = 0
+            if iall or (nfields < 50):
                 vv   = set_miss(imiss, vv)
                 vmin = np.nanmin(vv)
                 vmax = np.nanmax(vv)
             else:
+                # read at least 50 random 2D fields in one call,
+                # netcdf selects all combinations of leading indices.
+                # Take small dimensions whole and split the remaining
+                # number of fields over the larger dimensions.
                 rng = default_rng()
-                vmin = np.inf
-                vmax = -np.inf
-                for nn in range(50):
-                    ss = []
-                    for i in range(vv.ndim):
-                        if i < vv.ndim - 2:
-                            idim = rng.integers(0, vv.shape[i])
-                            s = slice(idim, idim + 1)
-                        else:
-                            s = slice(0, vv.shape[i])
-                        ss.append(s)
-                    ivv   = vv[tuple(ss)]
-                    ivv   = set_miss(imiss, ivv)
-                    ivmin = np.nanmin(ivv)
-                    ivmax = np.nanmax(ivv)
-                    vmin  = min(vmin, ivmin)
-                    vmax  = max(vmax, ivmax)
+                nlead = vv.ndim - 2
+                nleft = 50
+                nsel = [1] * nlead
+                isort = sorted(range(nlead), key=lambda i: vv.shape[i])
+                for k, i in enumerate(isort):
+                    nn = int(np.ceil(nleft**(1. / (nlead - k))))
+                    nsel[i] = min(nn, vv.shape[i])
+                    nleft = int(np.ceil(nleft / nsel[i]))
+                ss = []
+                for i in range(nlead):
+                    idim = rng.choice(vv.shape[i], nsel[i], replace=False)
+                    ss.append(np.sort(idim))
+                ss.extend([slice(0, vv.shape[-2]), slice(0, vv.shape[-1])])
+                ivv  = vv[tuple(ss)]
+                ivv  = set_miss(imiss, ivv)
+                vmin = np.nanmin(ivv)
+                vmax = np.nanmax(ivv)
+            self.ivminmax[(v, self.vall.get())] = (vmin, vmax)
             return (vmin, vmax)
         else:
             return (0, 1)
 
+    def read_block(self):
+        """
+        Read the plotted variable into memory for the animation.
+
+        The variable is read only if it is not larger than
+        `MAXBLOCKBYTES`, including a possible mask. Otherwise, each
+        frame is read from file as single time steps.
+
+        """
+        if self.ivar is None:
+            return
+        if (self.ivarblock is None) or (self.ivarblock[0] is not self.ivar):
+            self.ivarblock = (self.ivar, None, get_miss(self, self.ivar))
+        if self.ivarblock[1] is not None:
+            return
+        nbytes = self.ivar.size * (np.dtype(self.ivar.dtype).itemsize + 1)
+        if nbytes <= MAXBLOCKBYTES:
+            try:
+                vv = self.ivar[:]
+            except MemoryError:
+                estr  = ('Map: not enough memory to read var (' +
+                         self.ivar.name + '), read each frame')
+                print(estr)
+                return
+            self.ivarblock = (self.ivar, vv, self.ivarblock[2])
+
+    def read_tstep(self, it):
+        """
+        Read data of time step `it` into `self.ivv`.
+
+        The time step must be set in the dimension spinboxes already,
+        e.g. with `set_tstep`.
+
+        Returns False if the data is not 2-dimensional, True otherwise.
+
+        """
+        # get missing values only once per variable
+        if (self.ivarblock is None) or (self.ivarblock[0] is not self.ivar):
+            self.ivarblock = (self.ivar, None, get_miss(self, self.ivar))
+        if self.ivarblock[1] is None:
+            vv = self.ivar
+        else:
+            vv = self.ivarblock[1]
+        # reuse array of last frame
+        vv = get_slice_miss(self, self.vd, vv, out=self.ivvbuf,
+                            miss=self.ivarblock[2])
+        self.ivvbuf = vv
+        if vv.ndim < 2:
+            return False
+        if self.itrans_v:
+            vv = vv.T
+        if self.ishift_lon:
+            if np.ma.isMaskedArray(vv):
+                vv = np.roll(vv, vv.shape[1] // 2, axis=1)
+            else:
+                # roll into the same array in each frame
+                if ( (self.ivvrbuf is None) or
+                     (self.ivvrbuf.shape != vv.shape) or
+                     (self.ivvrbuf.dtype != vv.dtype) ):
+                    self.ivvrbuf = np.empty(vv.shape, dtype=vv.dtype)
+                nx = vv.shape[1]
+                ns = nx // 2
+                self.ivvrbuf[:, ns:] = vv[:, :nx - ns]
+                self.ivvrbuf[:, :ns] = vv[:, nx - ns:]
+                vv = self.ivvrbuf
+        self.ivv = vv
+        self.iitvv = it
+        return True
+
+    def redraw_later(self):
+        """
+        Redraw the plot after a short delay.
+
+        A pending redraw is cancelled so that the plot is redrawn only
+        once if, for example, an arrow of a spinbox is kept pressed.
+
+        """
+        if self.iredraw is not None:
+            self.after_cancel(self.iredraw)
+        self.iredraw = self.after(REDRAWDELAY, self.redraw)
+
     def reinit(self):
         """
         Reinitialise the panel from top.
@@ -1064,72 +1366,20 @@ class ncvMap(Frame):
         self.cols   = self.top.cols
         self.iunlim = -1
         self.nunlim = 0
+        # release data and caches of old file
+        self.ivar      = None
+        self.ivarblock = None
+        self.ivminmax  = {}
+        self.ixyproj   = None
+        self.iframes   = {}
+        self.ivvbuf    = None
+        self.ivvcbuf   = None
+        self.ivvrbuf   = None
+        self.itime     = {}
         # reset dimensions
-        for ll in self.vdlbl:
-            ll.destroy()
-        for ll in self.vd:
-            ll.destroy()
-        self.vdframe  = []
-        self.vdlblval = []
-        self.vdlbl    = []
-        self.vdval    = []
-        self.vd       = []
-        self.vdtip    = []
-        for i in range(self.maxdim):
-            vdframe, vdlblval, vdlbl, vdval, vd, vdtip = add_spinbox(
-                self.rowvd, label=str(i), values=(0,), wrap=True,
-                command=self.spinned_v, state=tk.DISABLED, tooltip='None')
-            self.vdframe.append(vdframe)
-            self.vdlblval.append(vdlblval)
-            self.vdlbl.append(vdlbl)
-            self.vdval.append(vdval)
-            self.vd.append(vd)
-            self.vdtip.append(vdtip)
-            vdframe.pack(side=tk.LEFT)
-        for ll in self.latdlbl:
-            ll.destroy()
-        for ll in self.latd:
-            ll.destroy()
-        self.latdframe  = []
-        self.latdlblval = []
-        self.latdlbl    = []
-        self.latdval    = []
-        self.latd       = []
-        self.latdtip    = []
-        for i in range(self.maxdim):
-            latdframe, latdlblval, latdlbl, latdval, latd, latdtip = (
-                add_spinbox(self.rowlatd, label=str(i), values=(0,), wrap=True,
-                            command=self.spinned_lat, state=tk.DISABLED,
-                            tooltip='None'))
-            self.latdframe.append(latdframe)
-            self.latdlblval.append(latdlblval)
-            self.latdlbl.append(latdlbl)
-            self.latdval.append(latdval)
-            self.latd.append(latd)
-            self.latdtip.append(latdtip)
-            latdframe.pack(side=tk.LEFT)
-        for ll in self.londlbl:
-            ll.destroy()
-        for ll in self.lond:
-            ll.destroy()
-        self.londframe  = []
-        self.londlblval = []
-        self.londlbl    = []
-        self.londval    = []
-        self.lond       = []
-        self.londtip    = []
-        for i in range(self.maxdim):
-            londframe, londlblval, londlbl, londval, lond, londtip = (
-                add_spinbox(self.rowlond, label=str(i), values=(0,), wrap=True,
-                            command=self.spinned_lon, state=tk.DISABLED,
-                            tooltip='None'))
-            self.londframe.append(londframe)
-            self.londlblval.append(londlblval)
-            self.londlbl.append(londlbl)
-            self.londval.append(londval)
-            self.lond.append(lond)
-            self.londtip.append(londtip)
-            londframe.pack(side=tk.LEFT)
+        self.reset_dims('vd', self.rowvd, self.spinned_v)
+        self.reset_dims('latd', self.rowlatd, self.spinned_lat)
+        self.reset_dims('lond', self.rowlond, self.spinned_lon)
         # set time step
         if ihavectk:
             self.tstep.configure(to=1)
@@ -1140,8 +1390,12 @@ class ncvMap(Frame):
             self.tstep['to'] = 1
         self.tstepval.set(0)
         self.repeat.set('repeat')
+        self.anim_mode = REPEATMODES.index('repeat')
         # set variables
         columns = [''] + self.cols
+        # variables and their index for next/previous buttons
+        self.icolumns = columns
+        self.ivindex  = { c: i for i, c in enumerate(columns) }
         if ihavectk:
             self.v.configure(values=columns)
         else:
@@ -1171,13 +1425,135 @@ class ncvMap(Frame):
             self.inv_lon.set(0)
             self.shift_lon.set(0)
             set_dim_lon(self)
+        self.set_global()
+
+    def reset_dims(self, dim, row, command):
+        """
+        Reset the spinboxes of dimensions to `self.maxdim` disabled
+        spinboxes.
+
+        `dim` is the prefix of the attributes of the spinboxes, i.e.
+        'vd', 'latd', or 'lond'. Existing spinboxes are reused, missing
+        spinboxes are added to the frame `row` with the command `command`,
+        and spinboxes beyond `self.maxdim` are hidden but kept for later
+        files with more dimensions.
+
+        """
+        dframe  = getattr(self, dim + 'frame')
+        dlblval = getattr(self, dim + 'lblval')
+        dlbl    = getattr(self, dim + 'lbl')
+        dval    = getattr(self, dim + 'val')
+        dd      = getattr(self, dim)
+        dtip    = getattr(self, dim + 'tip')
+        for i in range(len(dd)):
+            dlblval[i].set(str(i))
+            dd[i].configure(values=(0,), width=1, state=tk.DISABLED)
+            dval[i].set('0')
+            dtip[i].set('None')
+            if i < self.maxdim:
+                # re-pack in order after hidden spinboxes
+                if not dframe[i].winfo_manager():
+                    dframe[i].pack(side=tk.LEFT)
+            else:
+                dframe[i].pack_forget()
+        for i in range(len(dd), self.maxdim):
+            iframe, ilblval, ilbl, ival, idd, itip = add_spinbox(
+                row, label=str(i), values=(0,), wrap=True,
+                command=command, state=tk.DISABLED, tooltip='None')
+            dframe.append(iframe)
+            dlblval.append(ilblval)
+            dlbl.append(ilbl)
+            dval.append(ival)
+            dd.append(idd)
+            dtip.append(itip)
+            iframe.pack(side=tk.LEFT)
+
+    def set_cmap(self):
+        """
+        Set colormap on current plot.
+
+        Sets the colormap on the mesh or contours and the colorbar
+        without redrawing the map. Redraws the map if nothing was
+        plotted yet or if the contour levels depend on the new colormap.
+
+        """
+        cmap = self.cmap['text']
+        if self.rev_cmap.get():
+            cmap = cmap + '_r'
+        ncmap = mpl.colormaps[cmap].N
+        ncmap = ncmap if ncmap < 256 else 15
+        if ( (self.cc is None) or
+             ((not self.mesh.get()) and (ncmap != self.ncmap)) ):
+            self.redraw()
+            return
+        self.icmap = cmap
+        self.ncmap = ncmap
+        self.cc.set_cmap(cmap)
+        self.cb.update_normal(self.cc)
+        # cached frames are cleared when canvas is drawn
+        self.canvas.draw_idle()
+
+    def set_features(self):
+        """
+        Set features coast, borders, rivers, lakes, and grid on map.
+
+        Features are added to the current axes when they are checked the
+        first time. Afterwards, they are only shown or hidden so that
+        their geometries do not have to be projected again.
+
+        """
+        checks = {'coast': self.coast.get(),
+                  'borders': self.borders.get(),
+                  'rivers': self.rivers.get(),
+                  'lakes': self.lakes.get(),
+                  'grid': self.grid.get()}
+        for ff, ischecked in checks.items():
+            if ischecked and (ff not in self.ifeatures):
+                if ff == 'coast':
+                    # self.axes.coastlines()
+                    aa = self.axes.add_feature(cfeature.COASTLINE)
+                    # Labels are part of the background while grid lines
+                    # are animated on top of the data. So labels and lines
+                    # need separate gridliners, the former without lines.
+                    self.ilabels = self.axes.gridlines(
+                        draw_labels=True, x_inline=False, y_inline=False)
+                    self.ilabels.xlines = False
+                    self.ilabels.ylines = False
+                elif ff == 'borders':
+                    aa = self.axes.add_feature(cfeature.BORDERS,
+                                               edgecolor='grey')
+                elif ff == 'rivers':
+                    aa = self.axes.add_feature(cfeature.RIVERS)
+                elif ff == 'lakes':
+                    aa = self.axes.add_feature(cfeature.LAKES, alpha=0.5)
+                elif ff == 'grid':
+                    aa = self.axes.gridlines(draw_labels=False,
+                                             x_inline=False, y_inline=False)
+                self.ifeatures[ff] = aa
+            if ff in self.ifeatures:
+                self.ifeatures[ff].set_visible(ischecked)
+        if 'coast' in self.ifeatures:
+            # gridliner draws labels even if not visible
+            gl = self.ilabels
+            gl.top_labels = gl.bottom_labels = checks['coast']
+            gl.left_labels = gl.right_labels = checks['coast']
+            gl.geo_labels = checks['coast']
+        self.ioverlay = list(self.ifeatures.values())
+
+    def set_global(self):
+        """
+        Set global checkbutton if the longitudes span more than 150
+        degrees.
+
+        """
         x = self.lon.get()
         if (x != ''):
             gx, vx = vardim2var(x, self.groups)
             xx = selvar(self, vx)
             xx = get_slice_miss(self, self.lond, xx)
-            xx = xx + 360.
-            if (xx.max() - xx.min()) > 150.:
+            # non-finite values give NaN and hence not global,
+            # np.ptp would ignore masks
+            if np.ma.ptp(np.mod(xx, 360.)) > 150.:
                 self.iglobal.set(1)
             else:
                 self.iglobal.set(0)
@@ -1202,11 +1578,13 @@ class ncvMap(Frame):
         if self.dunlim[gz] and has_unlim:
             self.vdval[self.iunlim].set(it)
             self.tstepval.set(it)
-            time = self.time[gz]
-            try:
-                self.timelbl.set(np.around(time[it], 4))
-            except TypeError:
-                self.timelbl.set(time[it])
+            # round time of all steps only once
+            if gz not in self.itime:
+                try:
+                    self.itime[gz] = np.around(self.time[gz], 4)
+                except TypeError:
+                    self.itime[gz] = self.time[gz]
+            self.timelbl.set(self.itime[gz][it])
 
     def set_unlim(self, v):
         """
@@ -1242,10 +1620,146 @@ class ncvMap(Frame):
             else:
                 self.nunlim = 0
 
+    def stop_anim(self):
+        """
+        Stops the animation.
+
+        """
+        self.anim.event_source.stop()
+        self.anim_running = False
+
     #
     # Plotting
     #
 
+    def plot_mesh(self):
+        """
+        Plot data as mesh on the map.
+
+        Uses the faster pcolorfast if the data is on a regular grid that
+        does not need to be transformed to the map, i.e. if `self.iextent`
+        was set in redraw. Uses pcolormesh otherwise.
+
+        Returns the mesh.
+
+        """
+        if self.iextent is None:
+            return self.axes.pcolormesh(
+                self.ixx, self.iyy, self.ivv,
+                vmin=self.ivmin, vmax=self.ivmax,
+                cmap=self.icmap, shading='nearest',
+                transform=self.itrans)
+        else:
+            return self.axes.pcolorfast(
+                self.iextent[0:2], self.iextent[2:4], self.ivv,
+                vmin=self.ivmin, vmax=self.ivmax, cmap=self.icmap)
+
+    def plot_contour(self):
+        """
+        Plot data as filled contours on the map.
+
+        Contours are calculated in projection space. The coordinates are
+        transformed into the map projection only if they or the projection
+        changed since the last call, which is what cartopy's
+        `transform_first` would do on every call.
+
+        Returns the contour set.
+
+        """
+        xyp = self.ixyproj
+        if ( (xyp is None) or (xyp[0] != self.axes.projection) or
+             (not np.array_equal(xyp[1], self.ixxc)) or
+             (not np.array_equal(xyp[2], self.iyyc)) ):
+            xx = np.asarray(self.ixxc)
+            yy = np.asarray(self.iyyc)
+            pts = self.axes.projection.transform_points(self.itrans, xx, yy)
+            xp = pts[..., 0].reshape(xx.shape)
+            yp = pts[..., 1].reshape(yy.shape)
+            # matplotlib expects sorted x but it could be wrapped
+            ind = np.argsort(xp, axis=1)
+            if np.all(ind == np.arange(ind.shape[1])):
+                ind = None
+            else:
+                xp = np.take_along_axis(xp, ind, axis=1)
+                yp = np.take_along_axis(yp, ind, axis=1)
+            xyp = (self.axes.projection, self.ixxc, self.iyyc, xp, yp, ind)
+            self.ixyproj = xyp
+        # keep mask, e.g. of netcdf's auto-masking with valid_range
+        vv = np.ma.asarray(self.ivvc)
+        if xyp[5] is not None:
+            vv = np.take_along_axis(vv, xyp[5], axis=1)
+        return self.axes.contourf(
+            xyp[3], xyp[4], vv, self.ilevels,
+            vmin=self.ivmin, vmax=self.ivmax,
+            cmap=self.icmap, extend=self.iextend,
+            transform=self.axes.transData)
+
+    def plot_tstep(self, it):
+        """
+        Plot data of time step `it` on the current map.
+
+        Sets the time step, reads its data and sets it on the mesh or
+        replaces the contours. Does not draw the canvas.
+
+        Returns False if the data is not 2-dimensional, True otherwise.
+
+        """
+        self.set_tstep(it)
+        if not self.read_tstep(it):
+            return False
+        # set data
+        if self.imesh:
+            # Cartopy's GeoQuadMesh.set_array also sets the data of
+            # wrapped cells. Colour limits that are not given are taken
+            # from each frame as in pcolormesh. Recreate the mesh only if
+            # the data does not fit the mesh.
+            try:
+                self.cc.set_array(self.ivv)
+                if (self.ivmin is None) or (self.ivmax is None):
+                    # from all data as in pcolormesh, the mesh masks
+                    # wrapped cells. Works also if all data are missing.
+                    norm = self.cc.norm
+                    with norm.callbacks.blocked():
+                        norm.vmin = self.ivmin
+                        norm.vmax = self.ivmax
+                    norm.autoscale_None(
+                        np.ma.masked_invalid(self.ivv, copy=False))
+            except (TypeError, ValueError):
+                self.cc.remove()
+                self.cc = self.plot_mesh()
+            # self.cc.remove()
+            # self.cc = self.axes.imshow(
+            #     vv, vmin=self.ivmin, vmax=self.ivmax, cmap=self.icmap,
+            #     origin='upper', extent=self.img_extent,
+            #     transform=self.itrans)
+        else:
+            try:
+                self.cc.remove()
+            except AttributeError:
+                # matplotlib < 3.8: ContourSet is not a Collection
+                for coll in self.cc.collections:
+                    coll.remove()
+            if self.ixxc.shape[-1] > self.ixx.shape[-1]:
+                # cyclic point was added in redraw
+                if np.ma.isMaskedArray(self.ivv):
+                    self.ivvc = add_cyclic(self.ivv)
+                else:
+                    # fill always the same array
+                    shape = self.ivv.shape[:-1] + (self.ixxc.shape[-1],)
+                    if ( (self.ivvcbuf is None) or
+                         (self.ivvcbuf.shape != shape) or
+                         (self.ivvcbuf.dtype != self.ivv.dtype) ):
+                        self.ivvcbuf = np.empty(shape,
+                                                dtype=self.ivv.dtype)
+                    self.ivvcbuf[..., :-1] = self.ivv
+                    self.ivvcbuf[..., -1]  = self.ivv[..., 0]
+                    self.ivvc = self.ivvcbuf
+            else:
+                self.ivvc = self.ivv
+            self.cc = self.plot_contour()
+        self.iitcc = it
+        return True
+
     def redraw(self):
         """
         Redraws the plot.
@@ -1255,9 +1769,12 @@ class ncvMap(Frame):
         Then redraws the plot.
 
         """
+        # cancel pending redraw
+        if self.iredraw is not None:
+            self.after_cancel(self.iredraw)
+            self.iredraw = None
         # stop animation
-        self.anim.event_source.stop()
-        self.anim_running = False
+        self.stop_anim()
         # get all states
         # rowv
         v = self.v.get()
@@ -1289,17 +1806,16 @@ class ncvMap(Frame):
         rev_cmap = self.rev_cmap.get()
         mesh     = self.mesh.get()
         self.iiglobal = self.iglobal.get()
-        coast    = self.coast.get()
-        borders  = self.borders.get()
-        rivers   = self.rivers.get()
-        lakes    = self.lakes.get()
-        grid     = self.grid.get()
         if ihavectk:
             proj = self.proj.get()
         else:
             proj = self.proj['text']
         self.iproj = self.iprojs[self.projs.index(proj)]
         clon     = self.clon.get()
+        # options needed in update
+        self.itrans_v   = trans_v
+        self.imesh      = mesh
+        self.ishift_lon = shift_lon
         # set x, y, axes labels
         vx = 'None'
         vy = 'None'
@@ -1309,6 +1825,7 @@ class ncvMap(Frame):
             gz, vz = vardim2var(v, self.groups)
             if vz == self.tname[gz]:
                 # should throw an error later
+                self.ivar = selvar(self, self.tvar[gz])
                 if mesh:
                     vv = self.dtime[gz]
                     vlab = 'Year'
@@ -1317,6 +1834,7 @@ class ncvMap(Frame):
                     vlab = 'Date'
             else:
                 vv = selvar(self, vz)
+                self.ivar = vv
                 vlab = set_axis_label(vv)
             vv = get_slice_miss(self, self.vd, vv)
             if trans_v:
@@ -1356,11 +1874,6 @@ class ncvMap(Frame):
                 xlab = set_axis_label(xx)
             xx = get_slice_miss(self, self.lond, xx)
             # set central longitude of projection
-            # make in 0-360, otherwise always 0 if -180 to 180
-            if np.any(np.isfinite(xx)):
-                xx360 = (xx + 360.) % 360.
-            else:
-                xx360 = xx
             if xx.size > 1:
                 if xx.ndim > 1:
                     x0 = xx[:, 0].mean()
@@ -1380,7 +1893,8 @@ class ncvMap(Frame):
                     # round it to next 180 degrees to get 0 or 180
                     self.ixxmean = np.around(self.ixxmean / 180., 0) * 180.
             else:
-                self.ixxmean = xx360[0]
+                # make in 0-360, otherwise always 0 if -180 to 180
+                self.ixxmean = (xx[0] + 360.) % 360.
             # seems to work better if central lon in projection
             # is set from -180 to 180 even if lon is given in 0-360
             if self.ixxmean > 180.:
@@ -1395,8 +1909,17 @@ class ncvMap(Frame):
         # plot options
         if rev_cmap:
             cmap = cmap + '_r'
+        # release data of another variable read for animation
+        if ( (self.ivarblock is not None) and
+             (self.ivarblock[0] is not self.ivar) ):
+            self.ivarblock = None
         # Clear figure instead of axes because colorbar is on figure
         self.figure.clear()
+        self.cc          = None
+        self.ioverlay    = []
+        self.ifeatures   = {}
+        self.ibackground = None
+        self.iframes     = {}
         # Have to add axes again.
         self.axes = self.figure.add_subplot(
             111, projection=self.iproj(central_longitude=self.iclon))
@@ -1409,13 +1932,19 @@ class ncvMap(Frame):
             # set x and y to index if not selected
             if (x == ''):
                 nx = vv.shape[1]
-                xx = -180. + np.arange(nx) / float(nx) * 360.
-                xx += 0.5 * (xx[1] - xx[0])
+                if ('x', nx) not in self.idefault:
+                    xx = -180. + np.arange(nx) / float(nx) * 360.
+                    xx += 0.5 * (xx[1] - xx[0])
+                    self.idefault[('x', nx)] = xx
+                xx = self.idefault[('x', nx)]
                 xlab = ''
             if (y == ''):
                 ny = vv.shape[0]
-                yy = -90. + np.arange(ny) / float(ny) * 180.
-                yy += 0.5 * (yy[1] - yy[0])
+                if ('y', ny) not in self.idefault:
+                    yy = -90. + np.arange(ny) / float(ny) * 180.
+                    yy += 0.5 * (yy[1] - yy[0])
+                    self.idefault[('y', ny)] = yy
+                yy = self.idefault[('y', ny)]
                 ylab = ''
             # plot
             # cc = self.axes.imshow(vv[:, ::-1].T, aspect='auto', cmap=cmap,
@@ -1424,26 +1953,30 @@ class ncvMap(Frame):
             #                        interpolation='none')
             extend = 'neither'
             if vmin is not None:
-                vv = np.maximum(vv, vmin)
                 if vmax is None:
                     extend = 'min'
                 else:
                     extend = 'both'
-            if vmax is not None:
-                vv = np.minimum(vv, vmax)
-                if vmin is None:
-                    extend = 'max'
-                else:
-                    extend = 'both'
+            elif vmax is not None:
+                extend = 'max'
+            if extend != 'neither':
+                # one pass, all vmax if vmin > vmax
+                vv = np.clip(vv, vmin, vmax)
+            # invert coordinates, which are views before meshgrid
+            if inv_lon:
+                xx = xx[..., ::-1]
+            if inv_lat:
+                yy = yy[::-1, ...]
+            # 2D coordinates are read-only views, which are not changed
             if (xx.ndim == 1) and (yy.ndim == 1):
-                self.ixx, self.iyy = np.meshgrid(xx, yy)
+                self.ixx, self.iyy = np.meshgrid(xx, yy, copy=False)
             elif (xx.ndim == 1) and (yy.ndim == 2):
-                self.ixx, tmp = np.meshgrid(xx, yy[:, 0])
+                self.ixx = np.broadcast_to(xx, (yy.shape[0], xx.size))
                 self.iyy = yy
             elif (xx.ndim == 2) and (yy.ndim == 1):
-                self.ixx, self.iyy = np.meshgrid(xx, yy)
-                tmp, self.iyy = np.meshgrid(xx[0, :], yy)
                 self.ixx = xx
+                self.iyy = np.broadcast_to(yy[:, np.newaxis],
+                                           (yy.size, xx.shape[1]))
             elif (xx.ndim == 2) and (yy.ndim == 2):
                 self.ixx = xx
                 self.iyy = yy
@@ -1452,10 +1985,6 @@ class ncvMap(Frame):
                          ' dimensions not 1D or 2D:')
                 print(estr, xx.shape, yy.shape)
                 return
-            if inv_lon:
-                self.ixx = np.fliplr(self.ixx)
-            if inv_lat:
-                self.iyy = np.flipud(self.iyy)
             self.ivv = vv
             if self.iiglobal:
                 # cartopy.contourf needs cyclic longitude for wrap around
@@ -1477,23 +2006,47 @@ class ncvMap(Frame):
                 self.ixxc = self.ixx
                 self.iyyc = self.iyy
             self.itrans  = ccrs.PlateCarree()
+            # extent of regular grid in coordinates of PlateCarree
+            # projection for faster pcolorfast
+            self.iextent = None
+            if ( (self.iproj is ccrs.PlateCarree) and
+                 (xx.ndim == 1) and (yy.ndim == 1) and
+                 (xx.size > 1) and (yy.size > 1) and
+                 np.issubdtype(xx.dtype, np.number) and
+                 np.issubdtype(yy.dtype, np.number) ):
+                dx = np.diff(xx)
+                dy = np.diff(yy)
+                if ( (dx[0] != 0.) and (dy[0] != 0.) and
+                     np.allclose(dx, dx[0]) and np.allclose(dy, dy[0]) ):
+                    x0 = xx[0] - 0.5 * dx[0] - self.iclon
+                    x1 = xx[-1] + 0.5 * dx[0] - self.iclon
+                    y0 = yy[0] - 0.5 * dy[0]
+                    y1 = yy[-1] + 0.5 * dy[0]
+                    # grid must not wrap around the map
+                    if ( (min(x0, x1) >= -180.0001) and
+                         (max(x0, x1) <= 180.0001) ):
+                        self.iextent = (x0, x1, y0, y1)
             self.ivmin   = vmin
             self.ivmax   = vmax
             self.icmap   = cmap
             self.ncmap   = mpl.colormaps[self.icmap].N
             self.ncmap   = self.ncmap if self.ncmap < 256 else 15
             self.iextend = extend
+            # same contour levels in all time steps if vmin/vmax given
+            self.ilevels = self.ncmap
+            if (vmin is not None) and (vmax is not None):
+                levels = mpl.ticker.MaxNLocator(
+                    self.ncmap + 1, min_n_ticks=1).tick_values(vmin, vmax)
+                levels = levels[(levels >= vmin) & (levels <= vmax)]
+                if levels.size > 1:
+                    self.ilevels = levels
             if mesh:
                 try:
                     # vv is matrix notation: (row, col)
                     # self.cc = self.axes.pcolormesh(
                     #     xx, yy, vv, vmin=vmin, vmax=vmax, cmap=cmap,
                     #     shading='nearest')
-                    self.cc = self.axes.pcolormesh(
-                        self.ixx, self.iyy, self.ivv,
-                        vmin=self.ivmin, vmax=self.ivmax,
-                        cmap=self.icmap, shading='nearest',
-                        transform=self.itrans)
+                    self.cc = self.plot_mesh()
                     # self.cc = self.axes.imshow(
                     #     vv, vmin=vmin, vmax=vmax, cmap=cmap,
                     #     origin='upper', extent=self.img_extent,
@@ -1511,11 +2064,8 @@ class ncvMap(Frame):
                 try:
                     # if 1-D then len(x)==m (columns) and
                     #     len(y)==n (rows): v(n,m)
-                    self.cc = self.axes.contourf(
-                        self.ixxc, self.iyyc, self.ivvc, self.ncmap,
-                        vmin=self.ivmin, vmax=self.ivmax,
-                        cmap=self.icmap, extend=self.iextend,
-                        transform=self.itrans)
+                    # contour in projection space, coordinates are 2D
+                    self.cc = self.plot_contour()
                     self.cb = self.figure.colorbar(self.cc, fraction=0.05,
                                                    shrink=0.75, pad=0.07)
                     # self.cc, = self.axes.plot(yy, vv[0,:])
@@ -1526,29 +2076,24 @@ class ncvMap(Frame):
                           self.ivvc.shape)
                     return
             self.cb.set_label(vlab)
-            self.axes.format_coord = lambda x, y: format_coord_map(
-                x, y, self.axes, self.ixx, self.iyy, self.ivv)
+            self.axes.format_coord = self.format_coord
         # help(self.figure)
         if self.iiglobal:
             self.axes.set_global()
-        if coast:
-            # self.axes.coastlines()
-            self.axes.add_feature(cfeature.COASTLINE)
-            self.axes.gridlines(draw_labels=True, linewidth=0,
-                                x_inline=False, y_inline=False)
-        if borders:
-            self.axes.add_feature(cfeature.BORDERS, edgecolor='grey')
-        if rivers:
-            self.axes.add_feature(cfeature.RIVERS)
-        if lakes:
-            self.axes.add_feature(cfeature.LAKES, alpha=0.5)
         self.axes.xaxis.set_label_text(xlab)
         self.axes.yaxis.set_label_text(ylab)
-        if grid:
-            self.axes.gridlines(draw_labels=False,
-                                x_inline=False, y_inline=False)
+        self.set_features()
+        # time step of plotted data
+        try:
+            self.iit = int(self.vdval[self.iunlim].get())
+        except (ValueError, IndexError):
+            self.iit = None
+        self.iitcc = self.iit
+        self.iitvv = self.iit
+        # exclude animated artists from background
+        self.animated_artists()
         # redraw
-        self.canvas.draw()
+        self.canvas.draw_idle()
         self.toolbar.update()
 
     # def update(self, frame, isframe=False):
@@ -1558,95 +2103,73 @@ class ncvMap(Frame):
         """
         Updates data of the current plot.
 
+        Frames are kept in a cache without the map boundary so that time
+        steps do not have to be plotted again. Returns the map boundary,
+        which is drawn and blitted by the animation. Single frames
+        (`isframe=True`) are blitted directly.
+
         """
         if self.anim_first:
-            self.anim.event_source.stop()
-            self.anim_running = False
+            self.stop_anim()
             self.anim_first   = False
-            return
-        # variable
-        v = self.v.get()
-        if (v != ''):
-            trans_v   = self.trans_v.get()
-            mesh      = self.mesh.get()
-            rep       = self.repeat.get()
-            # inv_lon   = self.inv_lon.get()
-            # inv_lat   = self.inv_lat.get()
-            shift_lon = self.shift_lon.get()
-            gz, vz = vardim2var(v, self.groups)
-            if vz == self.tname[gz]:
-                vz = self.tvar[gz]
-            vv = selvar(self, vz)
-            # slice
+            return self.animated_artists()
+        if not (self.anim_running or isframe):
+            # animation restarts after resizing the canvas
+            self.stop_anim()
+            return self.animated_artists()
+        # variable plotted in redraw
+        if self.cc is not None:
             try:
                 it = int(self.vdval[self.iunlim].get())
                 if not isframe:
-                    if (self.anim_inc == 1) and (it == self.nunlim - 1):
-                        if rep == 'repeat':
-                            it = 0
-                        elif rep == 'reflect':
-                            self.anim_inc = -1
-                            it += self.anim_inc
-                        else:  # once
-                            self.anim.event_source.stop()
-                            self.anim_running = False
-                    elif (self.anim_inc == -1) and (it == 0):
-                        if rep == 'repeat':
-                            it = self.nunlim - 1
-                        elif rep == 'reflect':
-                            self.anim_inc = 1
-                            it += self.anim_inc
-                        else:  # once
-                            self.anim.event_source.stop()
-                            self.anim_running = False
+                    it, inc = _advance(it, self.anim_inc, self.nunlim,
+                                       self.anim_mode)
+                    if inc == 0:
+                        # end of animation, show current frame again
+                        self.stop_anim()
                     else:
-                        it += self.anim_inc
+                        self.anim_inc = inc
             except ValueError:
                 it = 0
-            self.set_tstep(it)
-            vv = get_slice_miss(self, self.vd, vv)
-            if vv.ndim < 2:
-                self.anim.event_source.stop()
-                self.anim_running = False
-                return
-            if trans_v:
-                vv = vv.T
-            if shift_lon:
-                vv = np.roll(vv, vv.shape[1] // 2, axis=1)
-            self.ivv = vv
-            # set data
-            if mesh:
-                # update works well on 'normal' pcolormesh but not on Cartopy's
-                # self.cc.set_array(vv)
-                # Both, imshow and pcolormesh need to remove the old
-                # image.AxesImage or collections.QuadMesh first and then redraw
-                # because the set_data (imshow) and set_array (pcolormesh) do
-                # not respect transformations.
-                self.cc.remove()
-                self.cc = self.axes.pcolormesh(
-                    self.ixx, self.iyy, self.ivv,
-                    vmin=self.ivmin, vmax=self.ivmax,
-                    cmap=self.icmap, shading='nearest',
-                    transform=self.itrans)
-                # self.cc.remove()
-                # self.cc = self.axes.imshow(
-                #     vv, vmin=self.ivmin, vmax=self.ivmax, cmap=self.icmap,
-                #     origin='upper', extent=self.img_extent,
-                #     transform=self.itrans)
+            if isframe and (it == self.iit):
+                # time step is shown already
+                return self.animated_artists()
+            if self.ibackground is None:
+                # canvas not drawn yet
+                if not self.plot_tstep(it):
+                    self.stop_anim()
+                    return ()
+                self.iit = it
+                self.canvas.draw_idle()
+                return ()
+            spine = self.axes.spines['geo']
+            if it in self.iframes:
+                # frame was shown before
+                self.set_tstep(it)
+                self.canvas.restore_region(self.iframes[it])
             else:
-                # http://matplotlib.1069221.n5.nabble.com/update-an-existing-contour-plot-with-new-data-td23889.html
-                for coll in self.cc.collections:
-                    self.axes.collections.remove(coll)
-                if self.iiglobal:
-                    # self.ivvc = add_cyclic(self.ivv)
-                    self.ivvc, self.ixxc = add_cyclic(
-                        self.ivv, x=self.ixx)
-                else:
-                    self.ivvc = self.ivv
-                self.cc = self.axes.contourf(
-                    self.ixxc, self.iyyc, self.ivvc, self.ncmap,
-                    vmin=self.ivmin, vmax=self.ivmax,
-                    cmap=self.icmap, extend=self.iextend,
-                    transform=self.itrans)
-            self.canvas.draw_idle()
-            return self.cc,
+                # clean background for blitting
+                self.canvas.restore_region(self.ibackground)
+                if not self.plot_tstep(it):
+                    self.stop_anim()
+                    return ()
+                for aa in self.animated_artists():
+                    if aa is not spine:
+                        self.axes.draw_artist(aa)
+                # copy_from_bbox rounds inwards, cache also the edges
+                region = self.canvas.copy_from_bbox(
+                    self.axes.bbox.padded(1))
+                x0, y0, x1, y1 = region.get_extents()
+                nmax = MAXFRAMEBYTES // max(4 * (x1 - x0) * (y1 - y0), 1)
+                while self.iframes and (len(self.iframes) >= nmax):
+                    del self.iframes[next(iter(self.iframes))]
+                if nmax > 0:
+                    self.iframes[it] = region
+            self.iit = it
+            if isframe:
+                # blit single frame, the animation blits all others
+                self.axes.draw_artist(spine)
+                self.canvas.blit(self.axes.bbox)
+                return ()
+            return (spine,)
+        return ()
@@ -26,6 +26,7 @@ The following methods are provided:
    analyse_netcdf
    get_miss
    get_slice_miss
+   load_imaps
    set_dim_lat
    set_dim_lon
    set_dim_var
@@ -65,8 +66,32 @@ History
     * Squeeze output in get_slice_miss only if more than 1 dim,
       Jan 2024, Matthias Cuntz
     * Allow multiple netcdf files, Jan 2024, Matthias Cuntz
+    * Optional output array in get_slice_miss, Oct 2026, Matthias Cuntz
+    * Added load_imaps to load colormap images on demand,
+      Oct 2026, Matthias Cuntz
+    * Optional list of missing values in get_slice_miss,
+      Oct 2026, Matthias Cuntz
+    * Attributes with getattr and default in get_miss,
+      Oct 2026, Matthias Cuntz
+    * Default fill value with dict.get in get_miss, Oct 2026, Matthias Cuntz
+    * Tooltips of dimensions from cached function _tooltip in set_dim_*,
+      Oct 2026, Matthias Cuntz
+    * Configure lat and lon dimensions only once in set_dim_var,
+      Oct 2026, Matthias Cuntz
+    * Check for scalars before and do not set missing values of strings
+      in get_slice_miss, Oct 2026, Matthias Cuntz
+    * Get missing values only if needed in get_slice_miss,
+      Oct 2026, Matthias Cuntz
+    * Shape and dimensions of variable only once in set_dim_*,
+      Oct 2026, Matthias Cuntz
+    * Width of spinboxes with _digits instead of np.log10 in set_dim_*,
+      Oct 2026, Matthias Cuntz
+    * set_dim_x/y/y2/z call common function _set_dim,
+      Oct 2026, Matthias Cuntz
+    * Reset only unused dimensions in set_dim_*, Oct 2026, Matthias Cuntz
 
 """
+import functools
 import tkinter as tk
 import numpy as np
 from .ncvutils import DIMMETHODS, get_slice, set_miss, spinbox_values
@@ -80,7 +105,7 @@ ncfill.update({np.dtype('<M8[ms]'): np.datetime64('NaT')})
 
 
 __all__ = ['analyse_netcdf',
-           'get_miss', 'get_slice_miss',
+           'get_miss', 'get_slice_miss', 'load_imaps',
            'set_dim_lat', 'set_dim_lon', 'set_dim_var',
            'set_dim_x', 'set_dim_y', 'set_dim_y2', 'set_dim_z']
 
@@ -513,23 +538,23 @@ def get_miss(self, x):
     >>> miss = get_miss(self, x)
 
     """
-    try:
-        out = [ncfill[x.dtype]]
-    except KeyError:
+    # dict.get and getattr with default instead of catching exceptions
+    fill = ncfill.get(x.dtype, None)
+    if fill is None:
         out = []
+    else:
+        out = [fill]
     try:
         if x.dtype != np.dtype('<M8[ms]'):
             out += [self.miss]
     except AttributeError:
         pass
-    try:
-        out += [x._FillValue]
-    except AttributeError:
-        pass
-    try:
-        out += [x.missing_value]
-    except AttributeError:
-        pass
+    fill = getattr(x, '_FillValue', None)
+    if fill is not None:
+        out += [fill]
+    fill = getattr(x, 'missing_value', None)
+    if fill is not None:
+        out += [fill]
     return out
 
 
@@ -537,7 +562,7 @@ def get_miss(self, x):
 # Get slice and set missing value
 #
 
-def get_slice_miss(self, dimspins, x):
+def get_slice_miss(self, dimspins, x, out=None, miss=None):
     """
     Convenience method to get list of missing values (get_miss),
     choose slice of array (get_slice), and set missing values to
@@ -549,8 +574,14 @@ def get_slice_miss(self, dimspins, x):
         ncvue class
     dimspins : list
         List of tk.Spinbox widgets of dimensions
-    x : netCDF4._netCDF4.Variable
-        netcdf variable
+    x : netCDF4._netCDF4.Variable or ndarray
+        netcdf variable or its data read into memory
+    out : ndarray, optional
+        Array of the extracted slice from a previous call, which will
+        be reused if it has the shape and data type of the new slice
+    miss : list, optional
+        List of missing values (default: get_miss(self, x)).
+        Must be given if `x` is an ndarray read from a netcdf variable.
 
     Returns
     -------
@@ -564,19 +595,53 @@ def get_slice_miss(self, dimspins, x):
     >>> xx = get_slice_miss(self, x)
 
     """
-    miss = get_miss(self, x)
     xx = get_slice(dimspins, x)
     if xx.ndim > 1:
         xx = xx.squeeze()
-    xx = set_miss(miss, xx)
     # catch variables that have only one string or similar
-    try:
-        sx = xx.shape[0]
-    except IndexError:
-        xx = np.array([np.nan])
+    if xx.ndim == 0:
+        return np.array([np.nan])
+    # strings cannot be set to NaN
+    if xx.dtype.kind not in 'SU':
+        if miss is None:
+            miss = get_miss(self, x)
+        xx = set_miss(miss, xx, out=out)
     return xx
 
 
+#
+# Load images of colormaps
+#
+
+def load_imaps(self, cmaps=None):
+    """
+    Load images of colormaps that were not loaded yet.
+
+    The images `self.imaps` of the colormaps `self.cmaps` are created
+    empty and only read from the files `self.imapfiles` when needed,
+    i.e. when the colormap menu is opened for the first time.
+
+    Parameters
+    ----------
+    self : class
+        ncvue class
+    cmaps : list of str, optional
+        Names of colormaps whose images will be loaded
+        (default: all colormaps in self.cmaps)
+
+    Examples
+    --------
+    >>> load_imaps(self, ['RdYlBu'])
+
+    """
+    if cmaps is None:
+        cmaps = self.cmaps
+    for cc in cmaps:
+        i = self.cmaps.index(cc)
+        if self.imaps[i].width() == 0:
+            self.imaps[i].configure(file=self.imapfiles[i])
+
+
 #
 # Set dimensions
 #
@@ -584,6 +649,61 @@ def get_slice_miss(self, dimspins, x):
 # set_dim_lat/lon/var could also be methods of ncvMap.
 # Leave them here for their concordance with set_dim_x/y/z
 
+@functools.lru_cache(maxsize=64)
+def _tooltip(n):
+    """
+    Tooltip of spinbox of a dimension of size `n`.
+
+    Parameters
+    ----------
+    n : int
+        Size of dimension
+
+    Returns
+    -------
+    str
+        Range of dimension values and dimension methods if `n` > 1,
+        'Single dimension: 0' otherwise
+
+    Examples
+    --------
+    >>> self.xdtip[i].set(_tooltip(xx.shape[i]))
+
+    """
+    if n > 1:
+        tstr  = "Specific dimension value: 0-{:d}\n".format(n - 1)
+        tstr += "or arithmetic operation on axis:\n"
+        tstr += "  " + ", ".join(DIMMETHODS)
+    else:
+        tstr = "Single dimension: 0"
+    return tstr
+
+
+def _digits(n):
+    """
+    Number of digits of the largest index of a dimension of size `n`.
+
+    Same as int(np.ceil(np.log10(n))) for `n` > 1 but with integer
+    arithmetic only.
+
+    Parameters
+    ----------
+    n : int
+        Size of dimension
+
+    Returns
+    -------
+    int
+        Number of digits of `n` - 1
+
+    Examples
+    --------
+    >>> ww = max(5, _digits(vv.shape[i]))
+
+    """
+    return len(str(max(n - 1, 0)))
+
+
 def set_dim_lat(self):
     """
     Set spinboxes of latitude-dimensions.
@@ -605,11 +725,7 @@ def set_dim_lat(self):
     >>> set_dim_lat(self)
 
     """
-    # reset dimensions
-    for i in range(self.maxdim):
-        self.latd[i].config(values=(0,), width=1, state=tk.DISABLED)
-        self.latdlblval[i].set(str(i))
-        self.latdtip[i].set("")
+    ndim = 0
     lat = self.lat.get()
     if lat != '':
         # set real dimensions
@@ -617,23 +733,25 @@ def set_dim_lat(self):
         if vl == self.tname[gl]:
             vl = self.tvar[gl]
         ll = selvar(self, vl)
+        # netcdf variable builds shape and dimensions at each access
+        shape = ll.shape
+        dims  = ll.dimensions
+        ndim  = len(shape)
         for i in range(ll.ndim):
-            ww = max(4, int(np.ceil(np.log10(ll.shape[i]))))
-            self.latd[i].config(values=spinbox_values(ll.shape[i]), width=ww,
+            ww = max(4, _digits(shape[i]))
+            self.latd[i].config(values=spinbox_values(shape[i]), width=ww,
                                 state=tk.NORMAL)
-            if (ll.shape[i] > 1):
+            if (shape[i] > 1):
                 self.latdval[i].set('all')
             else:
                 self.latdval[i].set(0)
-            self.latdlblval[i].set(ll.dimensions[i])
-            if ll.shape[i] > 1:
-                tstr  = "Specific dimension value: 0-{:d}\n".format(
-                    ll.shape[i] - 1)
-                tstr += "or arithmetic operation on axis:\n"
-                tstr += "  " + ", ".join(DIMMETHODS)
-            else:
-                tstr = "Single dimension: 0"
-            self.latdtip[i].set(tstr)
+            self.latdlblval[i].set(dims[i])
+            self.latdtip[i].set(_tooltip(shape[i]))
+    # reset unused dimensions
+    for i in range(ndim, self.maxdim):
+        self.latd[i].config(values=(0,), width=1, state=tk.DISABLED)
+        self.latdlblval[i].set(str(i))
+        self.latdtip[i].set("")
 
 
 def set_dim_lon(self):
@@ -657,11 +775,7 @@ def set_dim_lon(self):
     >>> set_dim_lon(self)
 
     """
-    # reset dimensions
-    for i in range(self.maxdim):
-        self.lond[i].config(values=(0,), width=1, state=tk.DISABLED)
-        self.londlblval[i].set(str(i))
-        self.londtip[i].set("")
+    ndim = 0
     lon = self.lon.get()
     if lon != '':
         # set real dimensions
@@ -669,23 +783,25 @@ def set_dim_lon(self):
         if vl == self.tname[gl]:
             vl = self.tvar[gl]
         ll = selvar(self, vl)
+        # netcdf variable builds shape and dimensions at each access
+        shape = ll.shape
+        dims  = ll.dimensions
+        ndim  = len(shape)
         for i in range(ll.ndim):
-            ww = max(4, int(np.ceil(np.log10(ll.shape[i]))))
-            self.lond[i].config(values=spinbox_values(ll.shape[i]), width=ww,
+            ww = max(4, _digits(shape[i]))
+            self.lond[i].config(values=spinbox_values(shape[i]), width=ww,
                                 state=tk.NORMAL)
-            if (ll.shape[i] > 1):
+            if (shape[i] > 1):
                 self.londval[i].set('all')
             else:
                 self.londval[i].set(0)
-            self.londlblval[i].set(ll.dimensions[i])
-            if ll.shape[i] > 1:
-                tstr  = "Specific dimension value: 0-{:d}\n".format(
-                    ll.shape[i] - 1)
-                tstr += "or arithmetic operation on axis:\n"
-                tstr += "  " + ", ".join(DIMMETHODS)
-            else:
-                tstr = "Single dimension: 0"
-            self.londtip[i].set(tstr)
+            self.londlblval[i].set(dims[i])
+            self.londtip[i].set(_tooltip(shape[i]))
+    # reset unused dimensions
+    for i in range(ndim, self.maxdim):
+        self.lond[i].config(values=(0,), width=1, state=tk.DISABLED)
+        self.londlblval[i].set(str(i))
+        self.londtip[i].set("")
 
 
 def set_dim_var(self):
@@ -713,11 +829,7 @@ def set_dim_var(self):
     >>> set_dim_var(self)
 
     """
-    # reset dimensions
-    for i in range(self.maxdim):
-        self.vd[i].config(values=(0,), width=1, state=tk.DISABLED)
-        self.vdlblval[i].set(str(i))
-        self.vdtip[i].set("")
+    ndim = 0
     v = self.v.get()
     if v != '':
         # set real dimensions
@@ -725,72 +837,129 @@ def set_dim_var(self):
         if vz == self.tname[gz]:
             vz = self.tvar[gz]
         vv = selvar(self, vz)
+        # netcdf variable builds shape and dimensions at each access
+        shape = vv.shape
+        dims  = vv.dimensions
+        ndim  = len(shape)
         nall = 0
         if self.latdim[gz]:
-            if self.latdim[gz] in vv.dimensions:
-                i = vv.dimensions.index(self.latdim[gz])
-                ww = max(5, int(np.ceil(np.log10(vv.shape[i]))))  # 5~median
-                self.vd[i].config(values=spinbox_values(vv.shape[i]), width=ww,
+            if self.latdim[gz] in dims:
+                i = dims.index(self.latdim[gz])
+                ww = max(5, _digits(shape[i]))  # 5~median
+                self.vd[i].config(values=spinbox_values(shape[i]), width=ww,
                                   state=tk.NORMAL)
                 nall += 1
                 self.vdval[i].set('all')
-                self.vdlblval[i].set(vv.dimensions[i])
-                if vv.shape[i] > 1:
-                    tstr  = "Specific dimension value: 0-{:d}\n".format(
-                        vv.shape[i] - 1)
-                    tstr += "or arithmetic operation on axis:\n"
-                    tstr += "  " + ", ".join(DIMMETHODS)
-                else:
-                    tstr = "Single dimension: 0"
-                self.vdtip[i].set(tstr)
+                self.vdlblval[i].set(dims[i])
+                self.vdtip[i].set(_tooltip(shape[i]))
         if self.londim[gz]:
-            if self.londim[gz] in vv.dimensions:
-                i = vv.dimensions.index(self.londim[gz])
-                ww = max(5, int(np.ceil(np.log10(vv.shape[i]))))  # 5~median
-                self.vd[i].config(values=spinbox_values(vv.shape[i]), width=ww,
+            if self.londim[gz] in dims:
+                i = dims.index(self.londim[gz])
+                ww = max(5, _digits(shape[i]))  # 5~median
+                self.vd[i].config(values=spinbox_values(shape[i]), width=ww,
                                   state=tk.NORMAL)
                 nall += 1
                 self.vdval[i].set('all')
-                self.vdlblval[i].set(vv.dimensions[i])
-                if vv.shape[i] > 1:
-                    tstr  = "Specific dimension value: 0-{:d}\n".format(
-                        vv.shape[i] - 1)
-                    tstr += "or arithmetic operation on axis:\n"
-                    tstr += "  " + ", ".join(DIMMETHODS)
-                else:
-                    tstr = "Single dimension: 0"
-                self.vdtip[i].set(tstr)
+                self.vdlblval[i].set(dims[i])
+                self.vdtip[i].set(_tooltip(shape[i]))
         for i in range(vv.ndim):
-            ww = max(5, int(np.ceil(np.log10(vv.shape[i]))))  # 5~median
-            self.vd[i].config(values=spinbox_values(vv.shape[i]), width=ww,
+            # lat and lon dimensions were set above
+            if ( (dims[i] == self.latdim[gz]) or
+                 (dims[i] == self.londim[gz]) ):
+                continue
+            ww = max(5, _digits(shape[i]))  # 5~median
+            self.vd[i].config(values=spinbox_values(shape[i]), width=ww,
                               state=tk.NORMAL)
-            if ( (vv.dimensions[i] != self.latdim[gz]) and
-                 (vv.dimensions[i] != self.londim[gz]) and
-                 (vv.dimensions[i] != self.dunlim[gz]) and
-                 (nall <= 1) and (vv.shape[i] > 1) ):
+            if ( (dims[i] != self.dunlim[gz]) and
+                 (nall <= 1) and (shape[i] > 1) ):
                 nall += 1
                 self.vdval[i].set('all')
-                self.vdlblval[i].set(vv.dimensions[i])
-                if vv.shape[i] > 1:
-                    tstr  = "Specific dimension value: 0-{:d}\n".format(
-                        vv.shape[i] - 1)
-                    tstr += "or arithmetic operation on axis:\n"
-                    tstr += "  " + ", ".join(DIMMETHODS)
-                else:
-                    tstr = "Single dimension: 0"
-                self.vdtip[i].set(tstr)
-            elif ((vv.dimensions[i] != self.latdim[gz]) and
-                  (vv.dimensions[i] != self.londim[gz])):
+            else:
                 self.vdval[i].set(0)
-                self.vdlblval[i].set(vv.dimensions[i])
-                if vv.shape[i] > 1:
-                    tstr  = "Specific dimension value: 0-{:d}\n".format(
-                        vv.shape[i] - 1)
-                    tstr += "or arithmetic operation on axis:\n"
-                    tstr += "  " + ", ".join(DIMMETHODS)
+            self.vdlblval[i].set(dims[i])
+            self.vdtip[i].set(_tooltip(shape[i]))
+    # reset unused dimensions
+    for i in range(ndim, self.maxdim):
+        self.vd[i].config(values=(0,), width=1, state=tk.DISABLED)
+        self.vdlblval[i].set(str(i))
+        self.vdtip[i].set("")
+
+
+def _set_dim(self, dim, v, nall):
+    """
+    Set spinboxes of dimensions `dim` of variable `v`.
+
+    Set labels and value lists, including 'all' to select all entries,
+    as well as 'mean', 'std', etc. for common operations on the axis.
+
+    Select 'all' for the unlimited dimension if it exists, and for
+    further dimensions up to `nall` dimensions with 'all' in total.
+    Select 0 for all other dimensions.
+
+    Parameters
+    ----------
+    self : class
+        ncvue class
+    dim : str
+        Prefix of the attributes of the spinboxes, e.g. 'xd' for
+        self.xd, self.xdval, self.xdlblval, and self.xdtip
+    v : str
+        Variable name as in the selection comboboxes
+    nall : int
+        Maximum number of dimensions with 'all'
+
+    Returns
+    -------
+    None
+        Labels and values of spinboxes of dimensions `dim` set.
+
+    Examples
+    --------
+    >>> _set_dim(self, 'xd', self.x.get(), 1)
+
+    """
+    dd      = getattr(self, dim)
+    dval    = getattr(self, dim + 'val')
+    dlblval = getattr(self, dim + 'lblval')
+    dtip    = getattr(self, dim + 'tip')
+    ndim = 0
+    if v != '':
+        # set real dimensions
+        gz, vz = vardim2var(v, self.groups)
+        if vz == self.tname[gz]:
+            vz = self.tvar[gz]
+        zz = selvar(self, vz)
+        # netcdf variable builds shape and dimensions at each access
+        shape = zz.shape
+        dims  = zz.dimensions
+        ndim  = len(shape)
+        nset = 0
+        if self.dunlim[gz] in dims:
+            i = dims.index(self.dunlim[gz])
+            ww = max(5, _digits(shape[i]))  # 5~median
+            dd[i].config(values=spinbox_values(shape[i]), width=ww,
+                         state=tk.NORMAL)
+            nset += 1
+            dval[i].set('all')
+            dlblval[i].set(dims[i])
+            dtip[i].set(_tooltip(shape[i]))
+        for i in range(zz.ndim):
+            if dims[i] != self.dunlim[gz]:
+                ww = max(5, _digits(shape[i]))
+                dd[i].config(values=spinbox_values(shape[i]), width=ww,
+                             state=tk.NORMAL)
+                if (nset < nall) and (shape[i] > 1):
+                    nset += 1
+                    dval[i].set('all')
                 else:
-                    tstr = "Single dimension: 0"
-                self.vdtip[i].set(tstr)
+                    dval[i].set(0)
+                dlblval[i].set(dims[i])
+                dtip[i].set(_tooltip(shape[i]))
+    # reset unused dimensions
+    for i in range(ndim, self.maxdim):
+        dd[i].config(values=(0,), width=1, state=tk.DISABLED)
+        dlblval[i].set(str(i))
+        dtip[i].set("")
 
 
 def set_dim_x(self):
@@ -818,54 +987,7 @@ def set_dim_x(self):
     >>> set_dim_x(self)
 
     """
-    # reset dimensions
-    for i in range(self.maxdim):
-        self.xd[i].config(values=(0,), width=1, state=tk.DISABLED)
-        self.xdlblval[i].set(str(i))
-        self.xdtip[i].set("")
-    x = self.x.get()
-    if x != '':
-        # set real dimensions
-        gx, vx = vardim2var(x, self.groups)
-        if vx == self.tname[gx]:
-            vx = self.tvar[gx]
-        xx = selvar(self, vx)
-        nall = 0
-        if self.dunlim[gx] in xx.dimensions:
-            i = xx.dimensions.index(self.dunlim[gx])
-            ww = max(5, int(np.ceil(np.log10(xx.shape[i]))))  # 5~median
-            self.xd[i].config(values=spinbox_values(xx.shape[i]), width=ww,
-                              state=tk.NORMAL)
-            nall += 1
-            self.xdval[i].set('all')
-            self.xdlblval[i].set(xx.dimensions[i])
-            if xx.shape[i] > 1:
-                tstr  = "Specific dimension value: 0-{:d}\n".format(
-                    xx.shape[i] - 1)
-                tstr += "or arithmetic operation on axis:\n"
-                tstr += "  " + ", ".join(DIMMETHODS)
-            else:
-                tstr = "Single dimension: 0"
-            self.xdtip[i].set(tstr)
-        for i in range(xx.ndim):
-            if xx.dimensions[i] != self.dunlim[gx]:
-                ww = max(5, int(np.ceil(np.log10(xx.shape[i]))))
-                self.xd[i].config(values=spinbox_values(xx.shape[i]), width=ww,
-                                  state=tk.NORMAL)
-                if (nall == 0) and (xx.shape[i] > 1):
-                    nall += 1
-                    self.xdval[i].set('all')
-                else:
-                    self.xdval[i].set(0)
-                self.xdlblval[i].set(xx.dimensions[i])
-                if xx.shape[i] > 1:
-                    tstr  = "Specific dimension value: 0-{:d}\n".format(
-                        xx.shape[i] - 1)
-                    tstr += "or arithmetic operation on axis:\n"
-                    tstr += "  " + ", ".join(DIMMETHODS)
-                else:
-                    tstr = "Single dimension: 0"
-                self.xdtip[i].set(tstr)
+    _set_dim(self, 'xd', self.x.get(), 1)
 
 
 def set_dim_y(self):
@@ -893,54 +1015,7 @@ def set_dim_y(self):
     >>> set_dim_y(self)
 
     """
-    # reset dimensions
-    for i in range(self.maxdim):
-        self.yd[i].config(values=(0,), width=1, state=tk.DISABLED)
-        self.ydlblval[i].set(str(i))
-        self.ydtip[i].set("")
-    y = self.y.get()
-    if y != '':
-        # set real dimensions
-        gy, vy = vardim2var(y, self.groups)
-        if vy == self.tname[gy]:
-            vy = self.tvar[gy]
-        yy = selvar(self, vy)
-        nall = 0
-        if self.dunlim[gy] in yy.dimensions:
-            i = yy.dimensions.index(self.dunlim[gy])
-            ww = max(5, int(np.ceil(np.log10(yy.shape[i]))))  # 5~median
-            self.yd[i].config(values=spinbox_values(yy.shape[i]), width=ww,
-                              state=tk.NORMAL)
-            nall += 1
-            self.ydval[i].set('all')
-            self.ydlblval[i].set(yy.dimensions[i])
-            if yy.shape[i] > 1:
-                tstr  = "Specific dimension value: 0-{:d}\n".format(
-                    yy.shape[i] - 1)
-                tstr += "or arithmetic operation on axis:\n"
-                tstr += "  " + ", ".join(DIMMETHODS)
-            else:
-                tstr = "Single dimension: 0"
-            self.ydtip[i].set(tstr)
-        for i in range(yy.ndim):
-            if yy.dimensions[i] != self.dunlim[gy]:
-                ww = max(5, int(np.ceil(np.log10(yy.shape[i]))))
-                self.yd[i].config(values=spinbox_values(yy.shape[i]), width=ww,
-                                  state=tk.NORMAL)
-                if (nall == 0) and (yy.shape[i] > 1):
-                    nall += 1
-                    self.ydval[i].set('all')
-                else:
-                    self.ydval[i].set(0)
-                self.ydlblval[i].set(yy.dimensions[i])
-                if yy.shape[i] > 1:
-                    tstr  = "Specific dimension value: 0-{:d}\n".format(
-                        yy.shape[i] - 1)
-                    tstr += "or arithmetic operation on axis:\n"
-                    tstr += "  " + ", ".join(DIMMETHODS)
-                else:
-                    tstr = "Single dimension: 0"
-                self.ydtip[i].set(tstr)
+    _set_dim(self, 'yd', self.y.get(), 1)
 
 
 def set_dim_y2(self):
@@ -968,54 +1043,7 @@ def set_dim_y2(self):
     >>> set_dim_y2(self)
 
     """
-    # reset dimensions
-    for i in range(self.maxdim):
-        self.y2d[i].config(values=(0,), width=1, state=tk.DISABLED)
-        self.y2dlblval[i].set(str(i))
-        self.y2dtip[i].set("")
-    y2 = self.y2.get()
-    if y2 != '':
-        # set real dimensions
-        gy2, vy2 = vardim2var(y2, self.groups)
-        if vy2 == self.tname[gy2]:
-            vy2 = self.tvar[gy2]
-        yy2 = selvar(self, vy2)
-        nall = 0
-        if self.dunlim[gy2] in yy2.dimensions:
-            i = yy2.dimensions.index(self.dunlim[gy2])
-            ww = max(5, int(np.ceil(np.log10(yy2.shape[i]))))  # 5~median
-            self.y2d[i].config(values=spinbox_values(yy2.shape[i]), width=ww,
-                               state=tk.NORMAL)
-            nall += 1
-            self.y2dval[i].set('all')
-            self.y2dlblval[i].set(yy2.dimensions[i])
-            if yy2.shape[i] > 1:
-                tstr  = "Specific dimension value: 0-{:d}\n".format(
-                    yy2.shape[i] - 1)
-                tstr += "or arithmetic operation on axis:\n"
-                tstr += "  " + ", ".join(DIMMETHODS)
-            else:
-                tstr = "Single dimension: 0"
-            self.y2dtip[i].set(tstr)
-        for i in range(yy2.ndim):
-            if yy2.dimensions[i] != self.dunlim[gy2]:
-                ww = max(5, int(np.ceil(np.log10(yy2.shape[i]))))
-                self.y2d[i].config(values=spinbox_values(yy2.shape[i]),
-                                   width=ww, state=tk.NORMAL)
-                if (nall == 0) and (yy2.shape[i] > 1):
-                    nall += 1
-                    self.y2dval[i].set('all')
-                else:
-                    self.y2dval[i].set(0)
-                self.y2dlblval[i].set(yy2.dimensions[i])
-                if yy2.shape[i] > 1:
-                    tstr  = "Specific dimension value: 0-{:d}\n".format(
-                        yy2.shape[i] - 1)
-                    tstr += "or arithmetic operation on axis:\n"
-                    tstr += "  " + ", ".join(DIMMETHODS)
-                else:
-                    tstr = "Single dimension: 0"
-                self.y2dtip[i].set(tstr)
+    _set_dim(self, 'y2d', self.y2.get(), 1)
 
 
 def set_dim_z(self):
@@ -1044,51 +1072,4 @@ def set_dim_z(self):
     >>> set_dim_z(self)
 
     """
-    # reset dimensions
-    for i in range(self.maxdim):
-        self.zd[i].config(values=(0,), width=1, state=tk.DISABLED)
-        self.zdlblval[i].set(str(i))
-        self.zdtip[i].set("")
-    z = self.z.get()
-    if z != '':
-        # set real dimensions
-        gz, vz = vardim2var(z, self.groups)
-        if vz == self.tname[gz]:
-            vz = self.tvar[gz]
-        zz = selvar(self, vz)
-        nall = 0
-        if self.dunlim[gz] in zz.dimensions:
-            i = zz.dimensions.index(self.dunlim[gz])
-            ww = max(5, int(np.ceil(np.log10(zz.shape[i]))))  # 5~median
-            self.zd[i].config(values=spinbox_values(zz.shape[i]), width=ww,
-                              state=tk.NORMAL)
-            nall += 1
-            self.zdval[i].set('all')
-            self.zdlblval[i].set(zz.dimensions[i])
-            if zz.shape[i] > 1:
-                tstr  = "Specific dimension value: 0-{:d}\n".format(
-                    zz.shape[i] - 1)
-                tstr += "or arithmetic operation on axis:\n"
-                tstr += "  " + ", ".join(DIMMETHODS)
-            else:
-                tstr = "Single dimension: 0"
-            self.zdtip[i].set(tstr)
-        for i in range(zz.ndim):
-            if zz.dimensions[i] != self.dunlim[gz]:
-                ww = max(5, int(np.ceil(np.log10(zz.shape[i]))))
-                self.zd[i].config(values=spinbox_values(zz.shape[i]), width=ww,
-                                  state=tk.NORMAL)
-                if (nall <= 1) and (zz.shape[i] > 1):
-                    nall += 1
-                    self.zdval[i].set('all')
-                else:
-                    self.zdval[i].set(0)
-                self.zdlblval[i].set(zz.dimensions[i])
-                if zz.shape[i] > 1:
-                    tstr  = "Specific dimension value: 0-{:d}\n".format(
-                        zz.shape[i] - 1)
-                    tstr += "or arithmetic operation on axis:\n"
-                    tstr += "  " + ", ".join(DIMMETHODS)
-                else:
-                    tstr = "Single dimension: 0"
-                self.zdtip[i].set(tstr)
+    _set_dim(self, 'zd', self.z.get(), 2)
@@ -32,6 +32,7 @@ History
    * Move themes/ and images/ back to src/ncvue/, Feb 2024, Matthias Cuntz
    * Add Quit button, Nov 2024, Matthias Cuntz
    * Use CustomTkinter if installed, Nov 2024, Matthias Cuntz
+   * Use draw_idle instead of draw in redraw, Oct 2026, Matthias Cuntz
 
 """
 import tkinter as tk
@@ -930,7 +931,7 @@ class ncvScatter(Frame):
                     xlim = xlim[::-1]
                     self.axes.set_xlim(xlim)
             # redraw
-            self.canvas.draw()
+            self.canvas.draw_idle()
             self.toolbar.update()
 
     def redraw_y2(self):
@@ -1036,7 +1037,7 @@ class ncvScatter(Frame):
                     xlim = xlim[::-1]
                     self.axes.set_xlim(xlim)
             # redraw
-            self.canvas.draw()
+            self.canvas.draw_idle()
             self.toolbar.update()
 
     def redraw(self, event=None):
@@ -1144,5 +1145,5 @@ class ncvScatter(Frame):
             self.redraw_y()
             self.redraw_y2()
             # redraw
-            self.canvas.draw()
+            self.canvas.draw_idle()
             self.toolbar.update()
@@ -23,6 +23,7 @@ The following functions are provided:
    format_coord_contour
    format_coord_map
    format_coord_scatter
+   get_cmaps
    get_slice
    list_intersection
    selvar
@@ -59,14 +60,29 @@ History
    * Increased digits in format_coord_scatter, Jan 2025, Matthias Cuntz
    * Increased digits in format_coord_contour and format_coord_map,
      Jan 2025, Matthias Cuntz
+   * Optional output array in set_miss, Oct 2026, Matthias Cuntz
+   * Added get_cmaps to share colormaps and their images between panels,
+     Oct 2026, Matthias Cuntz
+   * Skip duplicate and NaN missing values in set_miss,
+     Oct 2026, Matthias Cuntz
+   * Spinboxes and dimension methods in one pass in get_slice,
+     Oct 2026, Matthias Cuntz
+   * Cache tuples of spinbox_values per dimension size,
+     Oct 2026, Matthias Cuntz
+   * Group of variable with str.partition in vardim2var,
+     Oct 2026, Matthias Cuntz
 
 """
+import os
+import sys
+import functools
 import tkinter as tk
 try:
     from customtkinter import CTkToplevel as Toplevel
 except ModuleNotFoundError:
     from tkinter import Toplevel
 import numpy as np
+import matplotlib as mpl
 import matplotlib.dates as mpld
 import cartopy.crs as ccrs
 import ncvue
@@ -75,7 +91,7 @@ import ncvue
 __all__ = ['DIMMETHODS',
            'add_cyclic', 'has_cyclic', 'clone_ncvmain',
            'format_coord_contour', 'format_coord_map', 'format_coord_scatter',
-           'get_slice',
+           'get_cmaps', 'get_slice',
            'list_intersection', 'selvar', 'set_axis_label', 'set_miss',
            'spinbox_values', 'vardim2var', 'zip_dim_name_length']
 
@@ -96,6 +112,10 @@ var - variance
 """
 
 
+# colormaps and their images, shared by all panels of one Tk interpreter
+_CMAPS = {}
+
+
 def _add_cyclic_data(data, axis=-1):
     """
     Add a cyclic point to a data array.
@@ -643,6 +663,43 @@ def format_coord_scatter(x, y, ax, ax2, xdtype, ydtype, y2dtype):
     return out
 
 
+def get_cmaps(widget):
+    """
+    Get colormaps with their images
+
+    The names of the colormaps, the files of their images, and the images
+    are only made once per Tk interpreter and shared by all panels and
+    windows. The images are empty and will be loaded by the method
+    `load_imaps`.
+
+    Parameters
+    ----------
+    widget : tk widget
+        Any widget of the Tk interpreter of the images
+
+    Returns
+    -------
+    list of str, list of str, list of tk.PhotoImage
+        Sorted names of the colormaps without reversed colormaps (*_r),
+        files of their images, and their images
+
+    Examples
+    --------
+    >>> self.cmaps, self.imapfiles, self.imaps = get_cmaps(self)
+
+    """
+    if _CMAPS.get('tk') is not widget.tk:
+        cmaps = [ i for i in mpl.colormaps if not i.endswith('_r') ]
+        cmaps.sort()
+        bundle_dir = getattr(sys, '_MEIPASS',
+                             os.path.abspath(os.path.dirname(__file__)))
+        imapfiles = [ bundle_dir + '/images/' + i + '.png' for i in cmaps ]
+        imaps = [ tk.PhotoImage(master=widget) for i in cmaps ]
+        _CMAPS.update({'tk': widget.tk, 'cmaps': cmaps,
+                       'imapfiles': imapfiles, 'imaps': imaps})
+    return _CMAPS['cmaps'], _CMAPS['imapfiles'], _CMAPS['imaps']
+
+
 def get_slice(dimspins, y):
     """
     Get slice of variable `y` inquiring the spinboxes `dimspins`.
@@ -664,49 +721,45 @@ def get_slice(dimspins, y):
     >>> gy, vy = vardim2var(y, self.groups)
     >>> yy = selvar(self, vy)
     >>> miss = get_miss(self, yy)
-    >>> yy = get_slice_y(self.yd, yy).squeeze()
+    >>> yy = get_slice(self.yd, yy).squeeze()
     >>> yy = set_miss(miss, yy)
 
     """
-    methods = ['all']
-    methods.extend(DIMMETHODS)
-    dd = []
+    # one pass over the spinboxes, collecting axes with methods
     ss = []
+    ii = []
     for i in range(y.ndim):
         dim = dimspins[i].get()
-        if dim in methods:
+        if dim == 'all':
             s = slice(0, y.shape[i])
+        elif dim in DIMMETHODS:
+            s = slice(0, y.shape[i])
+            ii.append((i, dim))
         else:
             idim = int(dim)
             s = slice(idim, idim + 1)
-        dd.append(dim)
         ss.append(s)
     if len(ss) > 0:
-        imeth = list_intersection(dd, DIMMETHODS)
-        if len(imeth) > 0:
-            yout = y[tuple(ss)]
-            ii = [ i for i, d in enumerate(dd) if d in imeth ]
-            ii.reverse()  # last axis first
-            for i in ii:
-                if dd[i] == 'mean':
-                    yout = np.ma.mean(yout, axis=i)
-                elif dd[i] == 'std':
-                    yout = np.ma.std(yout, axis=i)
-                elif dd[i] == 'min':
-                    yout = np.ma.min(yout, axis=i)
-                elif dd[i] == 'max':
-                    yout = np.ma.max(yout, axis=i)
-                elif dd[i] == 'ptp':
-                    yout = np.ma.ptp(yout, axis=i)
-                elif dd[i] == 'sum':
-                    yout = np.ma.sum(yout, axis=i)
-                elif dd[i] == 'median':
-                    yout = np.ma.median(yout, axis=i)
-                elif dd[i] == 'var':
-                    yout = np.ma.var(yout, axis=i)
-            return yout
-        else:
-            return y[tuple(ss)]
+        yout = y[tuple(ss)]
+        ii.reverse()  # last axis first
+        for i, dd in ii:
+            if dd == 'mean':
+                yout = np.ma.mean(yout, axis=i)
+            elif dd == 'std':
+                yout = np.ma.std(yout, axis=i)
+            elif dd == 'min':
+                yout = np.ma.min(yout, axis=i)
+            elif dd == 'max':
+                yout = np.ma.max(yout, axis=i)
+            elif dd == 'ptp':
+                yout = np.ma.ptp(yout, axis=i)
+            elif dd == 'sum':
+                yout = np.ma.sum(yout, axis=i)
+            elif dd == 'median':
+                yout = np.ma.median(yout, axis=i)
+            elif dd == 'var':
+                yout = np.ma.var(yout, axis=i)
+        return yout
     else:
         return np.array([], dtype=y.dtype)
 
@@ -817,7 +870,7 @@ def set_axis_label(ncvar):
     return lab
 
 
-def set_miss(miss, x):
+def set_miss(miss, x, out=None):
     """
     Set `x` to NaN or NaT for all values in miss.
 
@@ -827,6 +880,9 @@ def set_miss(miss, x):
         values which shall be set to np.nan or np.datetime64('NaT') in `x`
     x : ndarray
         numpy array
+    out : ndarray, optional
+        Array in which the result is stored if it has the shape and
+        data type of the result. A new array is returned otherwise.
 
     Returns
     -------
@@ -845,11 +901,30 @@ def set_miss(miss, x):
         default = np.datetime64('NaT')
     else:
         default = np.nan
-    for mm in miss:
-        x = np.where(x == mm, default, x)
+    if len(miss) > 0:
+        dtype = np.result_type(x.dtype, default)
+        if (out is None) or (out.shape != x.shape) or (out.dtype != dtype):
+            out = np.empty(x.shape, dtype=dtype)
+        # data of masked arrays is copied without mask
+        np.copyto(out, x)
+        # one pass per missing value; skip duplicates and NaN/NaT,
+        # which are never equal
+        imiss = []
+        for mm in miss:
+            try:
+                if np.all(np.isnan(mm)):
+                    continue
+            except TypeError:
+                pass
+            if not any([ np.array_equal(mm, ii) for ii in imiss ]):
+                imiss.append(mm)
+        for mm in imiss:
+            np.copyto(out, default, where=(out == mm))
+        x = out
     return x
 
 
+@functools.lru_cache(maxsize=64)
 def spinbox_values(ndim):
     """
     Tuple for Spinbox values with 'all' before range(`ndim`) and
@@ -872,6 +947,7 @@ def spinbox_values(ndim):
     >>> self.xd0.config(values=spinbox_values(xx.shape[0]))
 
     """
+    # cached because it is called for every dimension of every variable
     if ndim > 1:
         return (('all',) + tuple(range(ndim)) + DIMMETHODS)
     else:
@@ -900,9 +976,9 @@ def vardim2var(vardim, groups=[]):
 
     """
     var = vardim[0:vardim.rfind('(')].rstrip()
-    if '/' in var:
-        g = var[0:var.find('/')].rstrip()
-        ig = list(groups).index(g)
+    g, sep, v = var.partition('/')
+    if sep:
+        ig = list(groups).index(g.rstrip())
     else:
         ig = 0
     return ig, var
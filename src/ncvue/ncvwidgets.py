@@ -52,6 +52,7 @@ History
    * Use CustomTkinter also in add_menu and add_scale,
      Dec 2024, Matthias Cuntz
    * Bugfix: did not make new frame in add_spinbox, Dec 2024, Matthias Cuntz
+   * postcommand in add_imagemenu, Oct 2026, Matthias Cuntz
 
 """
 import tkinter as tk
@@ -396,7 +397,7 @@ def add_entry(frame, label="", text="", command=None, tooltip="",
 
 
 def add_imagemenu(frame, label="", values=[], images=[], command=None,
-                  tooltip="", **kwargs):
+                  tooltip="", postcommand=None, **kwargs):
     """
     Add a left-aligned menu with menubuttons having text and images
     with a Label before.
@@ -417,6 +418,9 @@ def add_imagemenu(frame, label="", values=[], images=[], command=None,
     tooltip : str, optional
         Tooltip appearing after one second when hovering over
         the menu (default: "" = no tooltip)
+    postcommand : function, optional
+        Function to be called each time before the drop-down menu is
+        shown, e.g. to load images (default: None).
     **kwargs : option=value pairs, optional
         All other options will be passed to the main ttk.Menubutton
     tk.StringVar
@@ -450,7 +454,7 @@ def add_imagemenu(frame, label="", values=[], images=[], command=None,
     label.pack(side='left')
     mb = ttk.Menubutton(iframe, image=images[0], text=values[0],
                         compound='left')
-    sb = tk.Menu(mb, tearoff=False)
+    sb = tk.Menu(mb, tearoff=False, postcommand=postcommand)
     mb.config(menu=sb)
     for i, v in enumerate(values):
         sb.add_command(label=v, image=images[i], compound='left',